@@ -1,6 +1,7 @@
 import abc
 import collections.abc
 import enum
+import fractions
 import functools
 import itertools
 import operator
@@ -58,6 +59,7 @@ class SimpleAlgebra(Algebra):
 
         self.series = series
         self.rank = rank
+        self._hash = hash((series.value, rank))
 
     @staticmethod
     def _check_rank_bounds(series, rank):
@@ -82,7 +84,7 @@ class SimpleAlgebra(Algebra):
     __repr__ = __str__
 
     def __hash__(self):
-        return hash((self.series, self.rank))
+        return self._hash
 
     def __eq__(self, other):
         if not isinstance(other, SimpleAlgebra):
@@ -133,9 +135,110 @@ class SimpleAlgebra(Algebra):
         return generic_cartan_matrix(exceptional_elements)
 
     @property
+    @functools.lru_cache(maxsize=None)
+    def inverse_cartan_matrix(self):
+        n = self.rank
+        rows = [
+            list(map(fractions.Fraction, row))
+            + [fractions.Fraction(int(i == j)) for j in range(n)]
+            for i, row in enumerate(self.cartan_matrix)
+        ]
+
+        for column in range(n):
+            pivot = next(
+                index for index in range(column, n) if rows[index][column]
+            )
+            rows[column], rows[pivot] = rows[pivot], rows[column]
+            rows[column] = [
+                element / rows[column][column] for element in rows[column]
+            ]
+
+            for index in range(n):
+                if index != column and rows[index][column]:
+                    factor = rows[index][column]
+                    rows[index] = [
+                        element - factor * pivot_element
+                        for element, pivot_element
+                        in zip(rows[index], rows[column])
+                    ]
+
+        return [row[n:] for row in rows]
+
+    @property
+    @functools.lru_cache(maxsize=None)
+    def symmetrizer(self):
+        factors = [None] * self.rank
+        factors[0] = fractions.Fraction(1)
+        pending = [0]
+
+        cartan_matrix = self.cartan_matrix
+        while pending:
+            i = pending.pop()
+            for j, element in enumerate(cartan_matrix[i]):
+                if element and factors[j] is None:
+                    factors[j] = factors[i] * cartan_matrix[j][i] / element
+                    pending.append(j)
+
+        return factors
+
+    @functools.lru_cache(maxsize=None)
+    def root_coordinates(self, weight):
+        return tuple(
+            sum(
+                component * row[j]
+                for component, row in zip(weight, self.inverse_cartan_matrix)
+            )
+            for j in range(self.rank)
+        )
+
+    @functools.lru_cache(maxsize=None)
+    def congruence_class(self, weight):
+        return tuple(
+            coordinate % 1 for coordinate in self.root_coordinates(weight)
+        )
+
+    @property
+    @functools.lru_cache(maxsize=None)
     def simple_roots(self):
         return list(map(Weight, self.cartan_matrix))
 
+    def reflect(self, weight, index):
+        return weight - weight[index] * self.simple_roots[index]
+
+    @functools.lru_cache(maxsize=None)
+    def reflect_to_dominant(self, weight):
+        sign = 1
+        while True:
+            for index, component in enumerate(weight):
+                if component < 0:
+                    weight = self.reflect(weight, index)
+                    sign = -sign
+                    break
+            else:
+                return weight, sign
+
+    def dominant_weight(self, weight):
+        return self.reflect_to_dominant(weight)[0]
+
+    @functools.lru_cache(maxsize=None)
+    def weyl_orbit(self, weight):
+        current_weights = [self.dominant_weight(weight)]
+        orbit = set(current_weights)
+
+        while current_weights:
+            previous_weights = current_weights
+            current_weights = []
+
+            for weight in previous_weights:
+                for index, component in enumerate(weight):
+                    if component > 0:
+                        reflected_weight = self.reflect(weight, index)
+                        if reflected_weight not in orbit:
+                            orbit.add(reflected_weight)
+                            current_weights.append(reflected_weight)
+
+        return frozenset(orbit)
+
     @property
     @functools.lru_cache(maxsize=None)
     def highest_root(self):
@@ -314,6 +417,7 @@ class SemisimpleAlgebra(collections.abc.Iterable, Algebra):
     def __init__(self, simple_algebras):
         self.simple_algebras = simple_algebras
         self.rank = sum(simple_algebra.rank for simple_algebra in simple_algebras)
+        self._hash = hash(tuple(simple_algebras))
 
     def __str__(self):
         return " + ".join(map(str, self.simple_algebras))
@@ -321,7 +425,7 @@ class SemisimpleAlgebra(collections.abc.Iterable, Algebra):
     __repr__ = __str__
 
     def __hash__(self):
-        return hash(tuple(self.simple_algebras))
+        return self._hash
 
     def __eq__(self, other):
         if not isinstance(other, SemisimpleAlgebra):
@@ -366,6 +470,29 @@ class SemisimpleAlgebra(collections.abc.Iterable, Algebra):
     def join_weights(self, weights):
         return Weight(itertools.chain.from_iterable(weights))
 
+    @functools.lru_cache(maxsize=None)
+    def root_coordinates(self, weight):
+        return tuple(itertools.chain.from_iterable(
+            simple_algebra.root_coordinates(simple_weight)
+            for simple_algebra, simple_weight
+            in zip(self, self.split_weight(weight))
+        ))
+
+    def congruence_class(self, weight):
+        return tuple(itertools.chain.from_iterable(
+            simple_algebra.congruence_class(simple_weight)
+            for simple_algebra, simple_weight
+            in zip(self, self.split_weight(weight))
+        ))
+
+    @functools.lru_cache(maxsize=None)
+    def dominant_weight(self, weight):
+        return self.join_weights(
+            simple_algebra.dominant_weight(simple_weight)
+            for simple_algebra, simple_weight
+            in zip(self, self.split_weight(weight))
+        )
+
     @property
     @functools.lru_cache(maxsize=None)
     def level_vector(self):
@@ -0,0 +1,80 @@
+import functools
+
+import numpy
+
+
+class ArrayWeightSystem(object):
+    min_size = 32
+
+    def __init__(self, weights, counts):
+        self.weights = numpy.asarray(weights, dtype=numpy.int64)
+        self.counts = numpy.asarray(counts, dtype=numpy.int64)
+
+    def __len__(self):
+        return len(self.counts)
+
+    def __iter__(self):
+        return zip(map(tuple, self.weights.tolist()), self.counts.tolist())
+
+    @staticmethod
+    def from_counter(weights_with_multiplicities):
+        weights, counts = zip(*(
+            (weight.components, count)
+            for weight, count in weights_with_multiplicities.items()
+        ))
+
+        return ArrayWeightSystem(weights, counts)
+
+    def shifted(self, weight):
+        return ArrayWeightSystem(
+            self.weights + numpy.asarray(weight, dtype=numpy.int64),
+            self.counts
+        )
+
+    def scaled(self, factor):
+        return ArrayWeightSystem(factor * self.weights, self.counts)
+
+    def combined(self):
+        unique_weights, inverse = numpy.unique(
+            self.weights,
+            axis=0,
+            return_inverse=True
+        )
+        counts = numpy.bincount(
+            inverse.ravel(),
+            weights=self.counts,
+            minlength=len(unique_weights)
+        ).astype(numpy.int64)
+        nonzero = counts != 0
+
+        return ArrayWeightSystem(unique_weights[nonzero], counts[nonzero])
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _cartan_matrix(algebra):
+        return numpy.asarray(algebra.cartan_matrix, dtype=numpy.int64)
+
+    def racah_speiser(self, algebra):
+        simple_roots = ArrayWeightSystem._cartan_matrix(algebra)
+        weights = self.weights + 1
+        signs = numpy.ones(len(weights), dtype=numpy.int64)
+
+        while True:
+            negative = weights < 0
+            rows = numpy.flatnonzero(negative.any(axis=1))
+            if not len(rows):
+                break
+
+            indices = negative[rows].argmax(axis=1)
+            weights[rows] -= (
+                weights[rows, indices][:, numpy.newaxis]
+                * simple_roots[indices]
+            )
+            signs[rows] = -signs[rows]
+
+        regular = (weights > 0).all(axis=1)
+
+        return ArrayWeightSystem(
+            weights[regular] - 1,
+            signs[regular] * self.counts[regular]
+        ).combined()
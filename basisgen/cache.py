@@ -0,0 +1,126 @@
+import functools
+import inspect
+import os
+import pickle
+import sqlite3
+
+
+class PersistentCache(object):
+    version = 1
+
+    def __init__(self, path):
+        self.path = path
+        self._connection = None
+        self._pid = None
+
+    @property
+    def connection(self):
+        if self._connection is None or self._pid != os.getpid():
+            self._connection = sqlite3.connect(
+                self.path,
+                timeout=60,
+                isolation_level=None
+            )
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute("PRAGMA synchronous=NORMAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS {} "
+                "(key TEXT PRIMARY KEY, value BLOB)".format(self.table)
+            )
+            self._pid = os.getpid()
+
+        return self._connection
+
+    @property
+    def table(self):
+        return "results_v{}".format(self.version)
+
+    def __contains__(self, key):
+        return self.connection.execute(
+            "SELECT 1 FROM {} WHERE key = ?".format(self.table), (key,)
+        ).fetchone() is not None
+
+    def __getitem__(self, key):
+        row = self.connection.execute(
+            "SELECT value FROM {} WHERE key = ?".format(self.table), (key,)
+        ).fetchone()
+
+        if row is None:
+            raise KeyError(key)
+
+        return pickle.loads(row[0])
+
+    def __setitem__(self, key, value):
+        self.connection.execute(
+            "INSERT OR REPLACE INTO {} (key, value) VALUES (?, ?)".format(
+                self.table
+            ),
+            (key, pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL))
+        )
+
+    def close(self):
+        if self._connection is not None and self._pid == os.getpid():
+            self._connection.close()
+
+        self._connection = None
+
+
+_active_cache = None
+
+
+def enable(path):
+    global _active_cache
+
+    disable()
+    _active_cache = PersistentCache(path)
+
+    return _active_cache
+
+
+def disable():
+    global _active_cache
+
+    if _active_cache is not None:
+        _active_cache.close()
+
+    _active_cache = None
+
+
+def active_cache():
+    return _active_cache
+
+
+def signature(value):
+    return getattr(value, 'signature', None) or str(value)
+
+
+def persistent(kind):
+    def decorator(function):
+        parameters = inspect.signature(function)
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            cache = _active_cache
+            if cache is None:
+                return function(*args, **kwargs)
+
+            arguments = parameters.bind(*args, **kwargs)
+            arguments.apply_defaults()
+
+            key = ":".join(
+                [kind] + list(map(signature, arguments.arguments.values()))
+            )
+            try:
+                return cache[key]
+            except KeyError:
+                result = function(*args, **kwargs)
+                cache[key] = result
+                return result
+
+        return wrapper
+
+    return decorator
+
+
+if os.environ.get('BASISGEN_CACHE'):
+    enable(os.environ['BASISGEN_CACHE'])
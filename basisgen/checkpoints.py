@@ -0,0 +1,65 @@
+import hashlib
+import os
+import pickle
+
+
+class Checkpoint(object):
+    def __init__(self, path):
+        self.path = path
+        self.results = {}
+        self._file = None
+
+        if os.path.exists(path):
+            self._load()
+
+    @staticmethod
+    def for_run(directory, kind, fields, **options):
+        description = repr((
+            kind,
+            [field.signature for field in fields],
+            sorted(options.items())
+        ))
+        digest = hashlib.sha1(description.encode()).hexdigest()
+
+        os.makedirs(directory, exist_ok=True)
+        return Checkpoint(
+            os.path.join(directory, "{}-{}.pickle".format(kind, digest))
+        )
+
+    def _load(self):
+        with open(self.path, 'r+b') as checkpoint_file:
+            valid_length = 0
+            while True:
+                try:
+                    key, result = pickle.load(checkpoint_file)
+                except (EOFError, pickle.UnpicklingError, ValueError):
+                    break
+
+                self.results[key] = result
+                valid_length = checkpoint_file.tell()
+
+            checkpoint_file.truncate(valid_length)
+
+    def __contains__(self, key):
+        return key in self.results
+
+    def __getitem__(self, key):
+        return self.results[key]
+
+    def record(self, key, result):
+        if self._file is None:
+            self._file = open(self.path, 'ab')
+
+        pickle.dump(
+            (key, result),
+            self._file,
+            protocol=pickle.HIGHEST_PROTOCOL
+        )
+        self._file.flush()
+        self.results[key] = result
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+
+        self._file = None
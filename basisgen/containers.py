@@ -24,3 +24,21 @@ class OrderedCounter(collections.Counter, collections.OrderedDict):
         return OrderedCounter(collections.OrderedDict(
             sorted(items, key=key)
         ))
+
+
+class LRUCache(collections.OrderedDict):
+    def __init__(self, maxsize):
+        super().__init__()
+        self.maxsize = maxsize
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+
+        if len(self) > self.maxsize:
+            self.popitem(last=False)
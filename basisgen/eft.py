@@ -1,17 +1,31 @@
-from basisgen.representations import Irrep, IrrepCounter
+from basisgen.representations import (
+    GradedCharacter, Irrep, IrrepCounter, ProductPlan, VirtualIrrepCounter
+)
 from basisgen.lorentz import lorentz_algebra, vector, L_tensor, R_tensor
 from basisgen.statistics import Statistics
 from basisgen.partitions import partitions
 from basisgen.weights import Weight
+from basisgen.hilbert_series import HilbertSeries
+from basisgen.parallel import parallel_map, parallel_imap
+from basisgen.checkpoints import Checkpoint
+from basisgen.containers import LRUCache
 
-from collections import Counter
+from collections import Counter, deque
+from fractions import Fraction
 import functools
 import itertools
 import math
-from operator import mul
+from operator import add, mul
+from types import MappingProxyType
+
+
+def exact_charge(charge):
+    return Fraction(charge).limit_denominator()
 
 
 class Field(object):
+    ids = {}
+
     def __init__(
             self,
             name,
@@ -35,16 +49,25 @@ class Field(object):
         self.number_of_derivatives = number_of_derivatives
         self.number_of_flavors = number_of_flavors
         self._force_use_eom = False
+        self._id = None
+        self._derivatives = {}
+
+    @property
+    def id(self):
+        if self._id is None:
+            key = (self.name, self.number_of_derivatives, self.irrep)
+            self._id = Field.ids.setdefault(key, len(Field.ids))
+
+        return self._id
+
+    def __getstate__(self):
+        return dict(self.__dict__, _id=None, _derivatives={})
 
     def __hash__(self):
-        return hash((self.name, self.number_of_derivatives))
+        return self.id
 
     def __eq__(self, other):
-        return (
-            self.name == other.name
-            and self.number_of_derivatives == other.number_of_derivatives
-            and self.irrep == other.irrep
-        )
+        return self.id == other.id
 
     def __str__(self):
         if self.number_of_derivatives == 0:
@@ -72,18 +95,84 @@ class Field(object):
 
     def power_irreps(self, exponent):
         return (
-            [
-                self.irrep.power(inner_exponent, self.statistics)
-                for inner_exponent in partition
-            ]
-            for partition in partitions(exponent, self.number_of_flavors)
+            [irreps for _, irreps in factors]
+            for factors in self.power_factors(exponent)
         )
 
+    def power_factors(self, exponent):
+        return [[
+            (
+                "{}:{}:{}:{}".format(
+                    self.irrep.signature,
+                    self.statistics,
+                    exponent,
+                    self.number_of_flavors
+                ),
+                self.irrep.flavored_power(
+                    exponent,
+                    self.statistics,
+                    self.number_of_flavors
+                )
+            )
+        ]]
+
     @property
     def irrep(self):
         return self.lorentz_irrep + self.internal_irrep
 
+    @property
+    def signature(self):
+        return ":".join(map(str, [
+            self.name,
+            self.lorentz_irrep.signature,
+            self.internal_irrep.signature,
+            self.charges,
+            self.statistics,
+            self.dimension,
+            self.number_of_derivatives,
+            self.number_of_flavors,
+            self._force_use_eom
+        ]))
+
+    def structure(self, use_eom=False):
+        return ":".join(map(str, [
+            self.lorentz_irrep.signature,
+            self.internal_irrep.signature,
+            self.statistics,
+            self.dimension,
+            self.number_of_derivatives,
+            self.number_of_flavors,
+            use_eom or self._force_use_eom
+        ]))
+
     def differentiate(self, times, use_eom=True):
+        key = (times, use_eom or self._force_use_eom)
+        if key not in self._derivatives:
+            self._derivatives[key] = tuple(
+                self._differentiate(times, use_eom)
+            )
+
+        return self._derivatives[key]
+
+    def derivative_tower(self, max_derivatives, use_eom=True):
+        return {
+            n_derivatives: self.differentiate(n_derivatives, use_eom)
+            for n_derivatives in range(max_derivatives + 1)
+        }
+
+    def derivative_character(self, max_derivatives, use_eom=True, tower=None):
+        if tower is None:
+            tower = self.derivative_tower(max_derivatives, use_eom)
+
+        components = {0: VirtualIrrepCounter([self.irrep])}
+        for n_derivatives in range(1, max_derivatives + 1):
+            components[n_derivatives] = VirtualIrrepCounter(
+                derived_field.irrep for derived_field in tower[n_derivatives]
+            )
+
+        return GradedCharacter(components, max_derivatives)
+
+    def _differentiate(self, times, use_eom):
         if use_eom or self._force_use_eom:
             highest_weight = (
                 Weight([times, times]) + self.lorentz_irrep.highest_weight
@@ -152,14 +241,32 @@ class Field(object):
 
 
 class Operator(object):
+    __slots__ = ('_content', '_key', '_hash')
+
+    results_by_structure = LRUCache(maxsize=2**14)
+    power_levels = LRUCache(maxsize=2**14)
+
     def __init__(self, content):
-        self.content = Counter(content)
+        self._content = Counter(content)
+        self._key = tuple(sorted(
+            (field.id, exponent)
+            for field, exponent in self._content.items()
+            if exponent
+        ))
+        self._hash = hash(self._key)
+
+    @property
+    def content(self):
+        return MappingProxyType(self._content)
+
+    def __reduce__(self):
+        return Operator, (dict(self._content),)
 
     def __hash__(self):
-        return hash(frozenset(self.content.items()))
+        return self._hash
 
     def __eq__(self, other):
-        return self.content == other.content
+        return self._key == other._key
 
     def __str__(self):
         if not self.content:
@@ -176,7 +283,7 @@ class Operator(object):
     __repr__ = __str__
 
     def __mul__(self, other):
-        return Operator(self.content + other._to_operator().content)
+        return Operator(self._content + other._to_operator()._content)
 
     def _to_operator(self):
         return self
@@ -188,6 +295,39 @@ class Operator(object):
             for field, exponent in self.content.items()
         )
 
+    def structure(self, use_eom=False):
+        return tuple(sorted(
+            "{}^{}".format(field.structure(use_eom), exponent)
+            for field, exponent in self.content.items()
+        ))
+
+    @property
+    def conjugate(self):
+        conjugate_content = Counter()
+        for field, exponent in self.content.items():
+            conjugate_field = field.conjugate
+            conjugate_field._force_use_eom = field._force_use_eom
+            conjugate_content[conjugate_field] = exponent
+
+        return Operator(conjugate_content)
+
+    def canonical_structure(self, use_eom=False):
+        return min(
+            self.structure(use_eom),
+            self.conjugate.structure(use_eom)
+        )
+
+    def _result_by_structure(self, kind, structure, compute, *arguments):
+        key = (kind, structure) + arguments
+
+        try:
+            result = Operator.results_by_structure[key]
+        except KeyError:
+            result = compute(*arguments)
+            Operator.results_by_structure[key] = result
+
+        return dict(result)
+
     @property
     def charges(self):
         transposed_charges = zip(*(
@@ -197,22 +337,55 @@ class Operator(object):
 
         return [sum(charges) for charges in transposed_charges]
 
+    def estimated_cost(self, max_dimension):
+        max_derivatives = int(max_dimension - self.dimension)
+
+        return (max_derivatives + 1) ** 2 * functools.reduce(mul, (
+            (field.irrep.dimension * field.number_of_flavors) ** exponent
+            for field, exponent in self.content.items()
+        ), 1)
+
     @property
     def is_neutral(self):
-        return all(
-            math.isclose(charge, 0, abs_tol=1e-10)
-            for charge in self.charges
+        transposed_charges = zip(*(
+            [exact_charge(charge) * exponent for charge in field.charges]
+            for field, exponent in self.content.items()
+        ))
+
+        return all(sum(charges) == 0 for charges in transposed_charges)
+
+    def admits_singlets(self, max_dimension):
+        if not self.content:
+            return True
+
+        algebra = next(iter(self.content)).irrep.algebra
+        derivative_weight = (
+            vector + Irrep.singlet(algebra[2:])
+        ).highest_weight
+        total_weight = functools.reduce(add, (
+            exponent * field.irrep.highest_weight
+            for field, exponent in self.content.items()
+        ))
+
+        return any(
+            not any(algebra.congruence_class(
+                total_weight + n_derivatives * derivative_weight
+            ))
+            for n_derivatives in range(int(max_dimension - self.dimension) + 1)
         )
 
-    def differentiate_fields(self, times, use_eom):
+    def differentiate_fields(self, times, use_eom, derivatives=None):
         def differentiate_field_by_partition(field, partition):
-            chains = itertools.product(*(
-                field.differentiate(number_of_derivatives, use_eom=use_eom)
+            if derivatives is None:
+                tower = field.derivative_tower(max(partition), use_eom)
+            else:
+                tower = derivatives[field]
+
+            return itertools.product(*(
+                tower[number_of_derivatives]
                 for number_of_derivatives in partition
             ))
 
-            return (Operator(chain) for chain in chains)
-
         def chain_products(iterable_of_iterables):
             return itertools.chain.from_iterable(
                 itertools.product(*inner_iterable)
@@ -228,7 +401,7 @@ class Operator(object):
             for content_partition in partitions(times, len(self.content))
         )
 
-        operators_by_partition = chain_products(
+        chains_by_partition = chain_products(
             (
                 differentiate_field_by_partition(field, partition)
                 for partition, field in zip(content_partition, self.content)
@@ -237,69 +410,321 @@ class Operator(object):
         )
 
         return set(
-            functools.reduce(mul, operators)
-            for operators in operators_by_partition
+            Operator(itertools.chain.from_iterable(chains))
+            for chains in chains_by_partition
         )
 
     @staticmethod
-    def total_derivatives(initial_irrep, max_derivatives, initial_derivatives):
-        def possible_irreps(lorentz_irrep):
-            return initial_irrep * (
-                lorentz_irrep + Irrep.singlet(initial_irrep.algebra[2:])
+    @functools.lru_cache(maxsize=None)
+    def vector_powers(internal_algebra, number_of_derivatives):
+        internal_singlet = Irrep.singlet(internal_algebra)
+
+        return [
+            lorentz_irrep + internal_singlet
+            for lorentz_irrep in vector.power(
+                    number_of_derivatives,
+                    Statistics.BOSON
             )
+        ]
 
-        def vector_power(number_of_derivatives):
-            return vector.power(number_of_derivatives, Statistics.BOSON)
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def total_derivative_level(initial_irrep, number_of_derivatives):
+        return IrrepCounter(
+            irrep
+            for derivatives_irrep in Operator.vector_powers(
+                    initial_irrep.algebra[2:],
+                    number_of_derivatives
+            )
+            for irrep in initial_irrep * derivatives_irrep
+        )
 
+    @staticmethod
+    def total_derivatives(initial_irrep, max_derivatives, initial_derivatives):
         return {
             initial_derivatives + number_of_derivatives:
-            IrrepCounter(
-                irrep
-                for lorentz_irrep in vector_power(number_of_derivatives)
-                for irrep in possible_irreps(lorentz_irrep)
+            Operator.total_derivative_level(
+                initial_irrep,
+                number_of_derivatives
             )
             for number_of_derivatives in range(1, max_derivatives + 1)
         }
 
     @property
     def irreps(self):
+        return sum(
+            (plan.evaluate() for plan in self.multiplication_plans()),
+            IrrepCounter()
+        )
+
+    def _factor_possibilities(self):
         possibilities = itertools.product(*(
-            field.power_irreps(exponent)
+            field.power_factors(exponent)
             for field, exponent in self.content.items()
         ))
 
-        chains = map(itertools.chain.from_iterable, possibilities)
+        return (
+            list(itertools.chain.from_iterable(possibility))
+            for possibility in possibilities
+        )
+
+    @staticmethod
+    def field_power_levels(
+            field,
+            exponent,
+            max_derivatives,
+            use_eom,
+            tower=None
+    ):
+        key = (field.structure(use_eom), exponent)
+
+        try:
+            levels = Operator.power_levels[key]
+        except KeyError:
+            levels = {}
+
+        if max_derivatives not in levels:
+            character = field.derivative_character(
+                max_derivatives,
+                use_eom,
+                tower
+            ).power(
+                exponent,
+                field.statistics,
+                field.irrep.algebra,
+                multiplicity=field.number_of_flavors
+            )
+            levels = {
+                n_derivatives: IrrepCounter(
+                    dict(character.components.get(n_derivatives, {}))
+                )
+                for n_derivatives in range(max_derivatives + 1)
+            }
+            Operator.power_levels[key] = levels
 
-        return sum(
-            (functools.reduce(mul, chain) for chain in chains),
-            IrrepCounter()
+        return levels
+
+    def _level_factor_possibilities(
+            self,
+            n_derivatives,
+            max_derivatives,
+            use_eom,
+            derivatives=None
+    ):
+        levels = [
+            Operator.field_power_levels(
+                field,
+                exponent,
+                max_derivatives,
+                use_eom,
+                None if derivatives is None else derivatives[field]
+            )
+            for field, exponent in self.content.items()
+        ]
+
+        for distribution in partitions(n_derivatives, len(self.content)):
+            if all(
+                    field_levels.get(field_derivatives)
+                    for field_derivatives, field_levels
+                    in zip(distribution, levels)
+            ):
+                yield [
+                    (
+                        "{}^{}:D^{}".format(
+                            field.structure(use_eom),
+                            exponent,
+                            field_derivatives
+                        ),
+                        field_levels[field_derivatives]
+                    )
+                    for (field, exponent), field_derivatives, field_levels
+                    in zip(self.content.items(), distribution, levels)
+                ]
+
+    def multiplication_plans(self):
+        return [
+            ProductPlan(
+                (irreps for _, irreps in factors),
+                keys=(key for key, _ in factors)
+            )
+            for factors in self._factor_possibilities()
+        ]
+
+    @staticmethod
+    def _irreps_among(factor_possibilities, targets):
+        ceiling = ProductPlan.root_ceiling(targets)
+        out = IrrepCounter()
+
+        for factors in factor_possibilities:
+            _, last_factor = factors.pop(factors.index(max(
+                factors,
+                key=lambda factor: ProductPlan.size(factor[1])
+            )))
+            if factors:
+                others = ProductPlan(
+                    (irreps for _, irreps in factors),
+                    keys=(key for key, _ in factors)
+                ).evaluate(
+                    ProductPlan.add_ceilings(
+                        ceiling,
+                        ProductPlan.root_ceiling(
+                            irrep.conjugate for irrep in last_factor
+                        )
+                    )
+                )
+            else:
+                others = IrrepCounter([Irrep.singlet(targets[0].algebra)])
+
+            for target in targets:
+                out[target] += sum(
+                    last_count * others[irrep] * count
+                    for last_irrep, last_count in last_factor.items()
+                    for irrep, count
+                    in (target * last_irrep.conjugate).items()
+                )
+
+        return +out
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def singlet_sources(algebra, max_derivatives):
+        internal_components = [0] * algebra[2:].rank
+
+        return [
+            Irrep(algebra, Weight([left, right] + internal_components))
+            for left in range(max_derivatives + 1)
+            for right in range(left % 2, max_derivatives + 1, 2)
+        ]
+
+    def singlet_sources_with_derivatives(
+            self,
+            max_dimension,
+            use_eom,
+            derivatives=None
+    ):
+        return {
+            n_derivatives: irreps
+            for n_derivatives, (_, irreps) in self.extend_singlet_sources(
+                {},
+                max_dimension,
+                use_eom,
+                derivatives=derivatives
+            ).items()
+        }
+
+    def extend_singlet_sources(
+            self,
+            known_sources,
+            max_dimension,
+            use_eom,
+            final_dimension=None,
+            derivatives=None
+    ):
+        algebra = next(iter(self.content)).irrep.algebra
+        max_derivatives = int(max_dimension - self.dimension)
+        final_derivatives = int(
+            max(max_dimension, final_dimension or max_dimension)
+            - self.dimension
         )
+        sources = {}
+
+        for n_derivatives in range(max_derivatives + 1):
+            remaining_derivatives = final_derivatives - n_derivatives
+            known_remaining, irreps = known_sources.get(
+                n_derivatives,
+                (-1, IrrepCounter())
+            )
+            if known_remaining >= remaining_derivatives:
+                sources[n_derivatives] = (known_remaining, irreps)
+                continue
+
+            known_targets = set(Operator.singlet_sources(
+                algebra,
+                known_remaining
+            )) if known_remaining >= 0 else set()
+            new_targets = [
+                target
+                for target in Operator.singlet_sources(
+                    algebra,
+                    remaining_derivatives
+                )
+                if target not in known_targets
+            ]
+
+            sources[n_derivatives] = (
+                remaining_derivatives,
+                irreps + Operator._irreps_among(
+                    self._level_factor_possibilities(
+                        n_derivatives,
+                        max_derivatives,
+                        use_eom,
+                        derivatives
+                    ),
+                    new_targets
+                )
+            )
+
+        return sources
 
     def irreps_with_derivatives(
             self,
             max_dimension,
             filter_internal_singlets,
-            use_eom
+            use_eom,
+            counting=True,
+            derivatives=None
     ):
         max_derivatives = int(max_dimension - self.dimension)
 
+        if counting:
+            levels = {
+                n_derivatives: [
+                    ProductPlan(factors, keys).evaluate()
+                    for keys, factors in (
+                        zip(*possibility)
+                        for possibility in self._level_factor_possibilities(
+                                n_derivatives,
+                                max_derivatives,
+                                use_eom,
+                                derivatives
+                        )
+                    )
+                ]
+                for n_derivatives in range(max_derivatives + 1)
+            }
+        else:
+            levels = {
+                n_derivatives: [
+                    operator.irreps
+                    for operator in self.differentiate_fields(
+                            n_derivatives,
+                            use_eom,
+                            derivatives
+                    )
+                ]
+                for n_derivatives in range(max_derivatives + 1)
+            }
+
         return {
             n_derivatives:
             IrrepCounter.sum(
                 IrrepCounter({
                     irrep: count
-                    for irrep, count in operator.irreps.items()
+                    for irrep, count in irreps.items()
                     if not filter_internal_singlets or irrep[2:].is_singlet
                 })
-                for operator in self.differentiate_fields(
-                        n_derivatives,
-                        use_eom
-                )
+                for irreps in levels[n_derivatives]
             )
             for n_derivatives in range(max_derivatives + 1)
         }
 
     def irreps_without_total_derivatives(self, max_dimension, use_eom):
+        return self._remove_total_derivatives(
+            self.irreps_with_derivatives(max_dimension, True, use_eom),
+            max_dimension
+        )
+
+    def _remove_total_derivatives(self, out_irreps, max_dimension):
         def total_derivatives(initial_irrep, derivative_count):
             return Operator.total_derivatives(
                 initial_irrep,
@@ -314,8 +739,6 @@ class Operator(object):
                     for irrep, count in counter.items()
                 })
 
-        out_irreps = self.irreps_with_derivatives(max_dimension, True, use_eom)
-
         for derivative_count in range(int(max_dimension - self.dimension)):
             current_irreps = out_irreps[derivative_count].items()
 
@@ -329,7 +752,43 @@ class Operator(object):
             self,
             max_dimension,
             ignore_lower_dimensions=False,
-            use_eom=True
+            use_eom=True,
+            derivatives=None
+    ):
+        return self._result_by_structure(
+            'invariants',
+            self.canonical_structure(use_eom),
+            functools.partial(self._invariants, derivatives=derivatives),
+            max_dimension,
+            ignore_lower_dimensions,
+            use_eom
+        )
+
+    def _invariants(
+            self,
+            max_dimension,
+            ignore_lower_dimensions,
+            use_eom,
+            derivatives=None
+    ):
+        if not self.admits_singlets(max_dimension):
+            return {}
+
+        return self.invariants_from_sources(
+            self.singlet_sources_with_derivatives(
+                max_dimension,
+                use_eom,
+                derivatives
+            ),
+            max_dimension,
+            ignore_lower_dimensions
+        )
+
+    def invariants_from_sources(
+            self,
+            sources,
+            max_dimension,
+            ignore_lower_dimensions=False
     ):
         def correct_dimension(number_of_derivatives):
             return (
@@ -343,7 +802,14 @@ class Operator(object):
                 if irrep.is_singlet
             )
 
-        irreps = self.irreps_without_total_derivatives(max_dimension, use_eom)
+        max_derivatives = int(max_dimension - self.dimension)
+        irreps = self._remove_total_derivatives(
+            {
+                n_derivatives: IrrepCounter(sources[n_derivatives])
+                for n_derivatives in range(max_derivatives + 1)
+            },
+            max_dimension
+        )
 
         return {
             number_of_derivatives: sum_singlets(irrep_counter)
@@ -356,9 +822,31 @@ class Operator(object):
             self,
             max_dimension,
             ignore_lower_dimensions=False,
-            use_eom=True
+            use_eom=True,
+            derivatives=None
+    ):
+        return self._result_by_structure(
+            'covariants',
+            self.structure(use_eom),
+            functools.partial(self._covariants, derivatives=derivatives),
+            max_dimension,
+            ignore_lower_dimensions,
+            use_eom
+        )
+
+    def _covariants(
+            self,
+            max_dimension,
+            ignore_lower_dimensions,
+            use_eom,
+            derivatives=None
     ):
-        irreps = self.irreps_with_derivatives(max_dimension, False, use_eom)
+        irreps = self.irreps_with_derivatives(
+            max_dimension,
+            False,
+            use_eom,
+            derivatives=derivatives
+        )
         max_derivatives = max_dimension - self.dimension
 
         return {
@@ -494,6 +982,20 @@ class EFT(object):
         self.use_eom = use_eom
         self.cached_results = {}
 
+    def derivative_table(self, max_dimension, use_eom=True):
+        key = ('derivatives', max_dimension, use_eom)
+
+        if key not in self.cached_results:
+            self.cached_results[key] = {
+                field: field.derivative_tower(
+                    int(max_dimension - field.dimension),
+                    use_eom
+                )
+                for field in self.fields
+            }
+
+        return self.cached_results[key]
+
     @staticmethod
     def _combinations(fields, max_dimension):
         if not fields:
@@ -510,55 +1012,431 @@ class EFT(object):
             )
         )
 
-    def operators(self, max_dimension):
-        return map(Operator, EFT._combinations(self.fields, max_dimension))
+    @staticmethod
+    def charge_lattice(fields):
+        def lcm(first, second):
+            return first * second // math.gcd(first, second)
+
+        charges = [list(map(exact_charge, field.charges)) for field in fields]
+        denominators = [
+            functools.reduce(
+                lcm,
+                (charge.denominator for charge in component),
+                1
+            )
+            for component in zip(*charges)
+        ]
+
+        return [
+            tuple(
+                int(charge * denominator)
+                for charge, denominator in zip(field_charges, denominators)
+            )
+            for field_charges in charges
+        ]
+
+    @staticmethod
+    def _neutral_combinations(fields, max_dimension):
+        if len(set(len(field.charges) for field in fields)) > 1:
+            return (
+                combination
+                for combination in EFT._combinations(fields, max_dimension)
+                if Operator(combination).is_neutral
+            )
+
+        charges = EFT.charge_lattice(fields)
+        dimensions = [exact_charge(field.dimension) for field in fields]
+        number_of_charges = len(fields[0].charges) if fields else 0
+
+        lowest_ratios = [None] * len(fields)
+        highest_ratios = [None] * len(fields)
+        lowest = highest = (0,) * number_of_charges
+        for index in reversed(range(len(fields))):
+            ratios = [charge / dimensions[index] for charge in charges[index]]
+            lowest = tuple(map(min, ratios, lowest))
+            highest = tuple(map(max, ratios, highest))
+            lowest_ratios[index] = lowest
+            highest_ratios[index] = highest
+
+        def can_be_neutralized(index, budget, partial_charges):
+            return all(
+                budget * lowest <= -charge <= budget * highest
+                for charge, lowest, highest in zip(
+                        partial_charges,
+                        lowest_ratios[index],
+                        highest_ratios[index]
+                )
+            )
+
+        def combinations(index, budget, partial_charges):
+            if index == len(fields):
+                if not any(partial_charges):
+                    yield Counter()
+                return
+
+            if not can_be_neutralized(index, budget, partial_charges):
+                return
+
+            max_exponent = math.floor(budget / dimensions[index])
+            for exponent in range(max_exponent + 1):
+                inner_combinations = combinations(
+                    index + 1,
+                    budget - exponent * dimensions[index],
+                    [
+                        charge + exponent * field_charge
+                        for charge, field_charge
+                        in zip(partial_charges, charges[index])
+                    ]
+                )
+                for combination in inner_combinations:
+                    yield Counter({fields[index]: exponent}) + combination
+
+        return combinations(
+            0,
+            exact_charge(max_dimension),
+            [0] * number_of_charges
+        )
+
+    def operators(self, max_dimension, neutral_only=False):
+        if neutral_only:
+            combinations = EFT._neutral_combinations
+        else:
+            combinations = EFT._combinations
+
+        return map(Operator, combinations(self.fields, max_dimension))
+
+    def _map_operators(
+            self,
+            function,
+            operators,
+            max_dimension,
+            workers,
+            executor,
+            checkpoint,
+            printer
+    ):
+        results = {}
+        pending_operators = []
+
+        for operator in operators:
+            if checkpoint is not None and str(operator) in checkpoint:
+                results[operator] = checkpoint[str(operator)]
+            else:
+                pending_operators.append(operator)
+
+        def record(operator, result):
+            results[operator] = result
+            if checkpoint is not None:
+                checkpoint.record(str(operator), result)
+
+            printer.update(progress=len(results), total=len(operators))
+
+        if workers is None and executor is None:
+            for operator in pending_operators:
+                record(operator, function(operator))
+
+        else:
+            parallel_map(
+                function,
+                pending_operators,
+                [
+                    operator.estimated_cost(max_dimension)
+                    for operator in pending_operators
+                ],
+                workers=workers,
+                executor=executor,
+                callback=lambda index, result: record(
+                    pending_operators[index], result
+                )
+            )
+
+        if checkpoint is not None:
+            checkpoint.close()
+
+        return [results[operator] for operator in operators]
 
     def invariants(
             self,
             max_dimension,
             verbose=False,
             ignore_lower_dimension=False,
-            use_eom=True
+            use_eom=True,
+            workers=None,
+            executor=None,
+            checkpoint=None
     ):
-        result = {}
-
         operators_printer = ProgressPrinter(
             "Computing field content combinations...", "done.",
             printing_function=print if verbose else None
         )
         invariants_printer = ProgressPrinter(
-            "Computing invariants...", "done.", "({progress}/{total})",
+            "Computing invariants...", "done.",
+            "({progress}/{total} representatives)",
             printing_function=print if verbose else None
         )
 
         operators_printer.start()
-        operators = self.operators(max_dimension)
-        total = None
-        if verbose:
-            operators = list(operators)
-            total = len(operators)
+        operators = [
+            operator
+            for operator in self.operators(max_dimension, neutral_only=True)
+            if operator.content
+        ]
         operators_printer.end()
 
+        if checkpoint is not None:
+            checkpoint = Checkpoint.for_run(
+                checkpoint,
+                'invariants',
+                self.fields,
+                max_dimension=max_dimension,
+                ignore_lower_dimension=ignore_lower_dimension,
+                use_eom=use_eom
+            )
+
+        representatives = {}
+        for operator in operators:
+            representatives.setdefault(
+                operator.canonical_structure(use_eom),
+                operator
+            )
+
         invariants_printer.start()
-        for progress, operator in enumerate(operators):
-            invariants_printer.update(progress=progress, total=total)
+        results = self._map_operators(
+            functools.partial(
+                _operator_invariants,
+                max_dimension=max_dimension,
+                ignore_lower_dimension=ignore_lower_dimension,
+                use_eom=use_eom,
+                derivatives=self.derivative_table(max_dimension, use_eom)
+            ),
+            list(representatives.values()),
+            max_dimension,
+            workers,
+            executor,
+            checkpoint,
+            invariants_printer
+        )
+        invariants_printer.end()
 
-            if operator.content and operator.is_neutral:
-                result[operator] = operator.invariants(
-                    max_dimension,
-                    ignore_lower_dimension,
+        results_by_structure = dict(zip(representatives, results))
+
+        return EFT.Invariants({
+            operator: dict(
+                results_by_structure[operator.canonical_structure(use_eom)]
+            )
+            for operator in operators
+        })
+
+    def invariants_sweep(
+            self,
+            dimensions,
+            verbose=False,
+            ignore_lower_dimension=False,
+            use_eom=True
+    ):
+        dimensions = list(dimensions)
+
+        for max_dimension in dimensions:
+            invariants_printer = ProgressPrinter(
+                "Computing invariants up to dimension {}...".format(
+                    max_dimension
+                ),
+                "done.", "({progress}/{total})",
+                printing_function=print if verbose else None
+            )
+
+            operators = [
+                operator
+                for operator in self.operators(
+                        max_dimension,
+                        neutral_only=True
+                )
+                if operator.content
+            ]
+
+            result = {}
+            invariants_by_structure = {}
+            for progress, operator in enumerate(operators):
+                invariants_printer.update(
+                    progress=progress,
+                    total=len(operators)
+                )
+
+                canonical_structure = operator.canonical_structure(use_eom)
+                if canonical_structure in invariants_by_structure:
+                    result[operator] = dict(
+                        invariants_by_structure[canonical_structure]
+                    )
+                    continue
+
+                if not operator.admits_singlets(max_dimension):
+                    result[operator] = invariants_by_structure[
+                        canonical_structure
+                    ] = {}
+                    continue
+
+                key = (
+                    'singlet_sources',
+                    operator.structure(use_eom),
                     use_eom
                 )
-        invariants_printer.end()
+                sources = operator.extend_singlet_sources(
+                    self.cached_results.get(key, {}),
+                    max_dimension,
+                    use_eom,
+                    final_dimension=max(dimensions),
+                    derivatives=self.derivative_table(
+                        max(dimensions),
+                        use_eom
+                    )
+                )
+                self.cached_results[key] = sources
+
+                result[operator] = operator.invariants_from_sources(
+                    {
+                        n_derivatives: irreps
+                        for n_derivatives, (_, irreps) in sources.items()
+                    },
+                    max_dimension,
+                    ignore_lower_dimension
+                )
+                invariants_by_structure[canonical_structure] = dict(
+                    result[operator]
+                )
+            invariants_printer.end()
 
-        return EFT.Invariants(result)
+            yield max_dimension, EFT.Invariants(result)
 
-    def covariants(
+    def iter_invariants(
+            self,
+            max_dimension,
+            ignore_lower_dimension=False,
+            use_eom=True,
+            workers=None,
+            executor=None,
+            sinks=()
+    ):
+        operators = (
+            operator
+            for operator in self.operators(max_dimension, neutral_only=True)
+            if operator.content
+        )
+        compute_invariants = functools.partial(
+            _operator_invariants,
+            max_dimension=max_dimension,
+            ignore_lower_dimension=ignore_lower_dimension,
+            use_eom=use_eom,
+            derivatives=self.derivative_table(max_dimension, use_eom)
+        )
+
+        results_by_structure = {}
+        waiting = {}
+        ready = deque()
+
+        def representatives():
+            for operator in operators:
+                structure = operator.canonical_structure(use_eom)
+                if structure in results_by_structure:
+                    ready.append(
+                        (operator, dict(results_by_structure[structure]))
+                    )
+                elif structure in waiting:
+                    waiting[structure].append(operator)
+                else:
+                    waiting[structure] = []
+                    yield operator
+
+        if workers is None and executor is None:
+            representative_results = (
+                (operator, compute_invariants(operator))
+                for operator in representatives()
+            )
+        else:
+            representative_results = parallel_imap(
+                compute_invariants,
+                representatives(),
+                workers=workers,
+                executor=executor
+            )
+
+        def results():
+            for representative, invariants in representative_results:
+                structure = representative.canonical_structure(use_eom)
+                results_by_structure[structure] = invariants
+
+                yield representative, invariants
+                for operator in waiting.pop(structure):
+                    yield operator, dict(invariants)
+
+                while ready:
+                    yield ready.popleft()
+
+            while ready:
+                yield ready.popleft()
+
+        for operator, invariants in results():
+            for sink in sinks:
+                sink.write(operator, invariants)
+
+            yield operator, invariants
+
+    def hilbert_series(
             self,
             max_dimension,
             verbose=False,
             ignore_lower_dimension=False,
             use_eom=True
+    ):
+        operators_printer = ProgressPrinter(
+            "Computing field content combinations...", "done.",
+            printing_function=print if verbose else None
+        )
+        series_printer = ProgressPrinter(
+            "Expanding the Hilbert series...", "done.",
+            printing_function=print if verbose else None
+        )
+
+        operators_printer.start()
+        operators = [
+            operator
+            for operator in self.operators(max_dimension, neutral_only=True)
+            if operator.content
+        ]
+        operators_printer.end()
+
+        series_printer.start()
+        series = HilbertSeries(
+            self.fields,
+            max_dimension,
+            use_eom,
+            self.derivative_table(max_dimension, use_eom)
+        )
+        contents = [
+            tuple(operator.content.get(field, 0) for field in self.fields)
+            for operator in operators
+        ]
+        counts = series.invariants(contents)
+        series_printer.end()
+
+        return EFT.Invariants({
+            operator: {
+                n_derivatives: count
+                for n_derivatives, count in sorted(counts[content].items())
+                if not ignore_lower_dimension
+                or n_derivatives == max_dimension - operator.dimension
+            }
+            for operator, content in zip(operators, contents)
+        })
+
+    def covariants(
+            self,
+            max_dimension,
+            verbose=False,
+            ignore_lower_dimension=False,
+            use_eom=True,
+            workers=None,
+            executor=None,
+            checkpoint=None
     ):
         result = {}
 
@@ -573,36 +1451,86 @@ class EFT(object):
         )
 
         operators_printer.start()
-        operators = list(self.operators(max_dimension))
-        total = len(operators)
+        operators = [
+            operator for operator in self.operators(max_dimension)
+            if operator.content
+        ]
         operators_printer.end()
 
+        if checkpoint is not None:
+            checkpoint = Checkpoint.for_run(
+                checkpoint,
+                'covariants',
+                self.fields,
+                max_dimension=max_dimension,
+                ignore_lower_dimension=ignore_lower_dimension,
+                use_eom=use_eom
+            )
+
         covariants_printer.start()
-        for progress, operator in enumerate(operators):
-            covariants_printer.update(progress=progress, total=total)
+        all_covariants = self._map_operators(
+            functools.partial(
+                _operator_covariants,
+                max_dimension=max_dimension,
+                ignore_lower_dimension=ignore_lower_dimension,
+                use_eom=use_eom,
+                derivatives=self.derivative_table(max_dimension, use_eom)
+            ),
+            operators,
+            max_dimension,
+            workers,
+            executor,
+            checkpoint,
+            covariants_printer
+        )
 
-            if operator.content:
-                covariants = operator.covariants(
-                    max_dimension,
-                    ignore_lower_dimension,
-                    use_eom
-                )
-                for number_of_derivatives, irreps in covariants.items():
-                    for irrep, count in irreps.items():
-                        irrep_with_charges = (
-                            irrep.highest_weight[:2],
-                            irrep.highest_weight[2:],
-                            tuple(operator.charges)
-                        )
-                        result.setdefault(irrep_with_charges, Counter())
-                        result[irrep_with_charges] += Counter({
-                            (operator, number_of_derivatives): count
-                        })
+        for operator, covariants in zip(operators, all_covariants):
+            for number_of_derivatives, irreps in covariants.items():
+                for irrep, count in irreps.items():
+                    irrep_with_charges = (
+                        irrep.highest_weight[:2],
+                        irrep.highest_weight[2:],
+                        tuple(operator.charges)
+                    )
+                    result.setdefault(irrep_with_charges, Counter())
+                    result[irrep_with_charges] += Counter({
+                        (operator, number_of_derivatives): count
+                    })
         covariants_printer.end()
 
         return EFT.Covariants(result)
 
 
+def _operator_invariants(
+        operator,
+        max_dimension,
+        ignore_lower_dimension,
+        use_eom,
+        derivatives=None
+):
+    return operator.invariants(
+        max_dimension,
+        ignore_lower_dimension,
+        use_eom,
+        derivatives
+    )
+
+
+def _operator_covariants(
+        operator,
+        max_dimension,
+        ignore_lower_dimension,
+        use_eom,
+        derivatives=None
+):
+    return operator.covariants(
+        max_dimension,
+        ignore_lower_dimension,
+        use_eom,
+        derivatives
+    )
+
+
 class ProgressPrinter(object):
     def __init__(
             self,
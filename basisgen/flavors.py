@@ -0,0 +1,203 @@
+from basisgen.eft import EFT
+from basisgen.parallel import parallel_map
+
+from fractions import Fraction
+import functools
+import itertools
+
+
+class FlavorPolynomial(object):
+    def __init__(self, coefficients):
+        coefficients = [Fraction(coefficient) for coefficient in coefficients]
+        while coefficients and coefficients[-1] == 0:
+            coefficients.pop()
+
+        self.coefficients = tuple(coefficients)
+
+    @staticmethod
+    def interpolate(values):
+        coefficients = [Fraction(0)] * len(values)
+
+        for node, value in values.items():
+            basis = [Fraction(1)]
+            denominator = 1
+            for other_node in values:
+                if other_node == node:
+                    continue
+
+                basis = [
+                    previous - other_node * current
+                    for previous, current in zip([0] + basis, basis + [0])
+                ]
+                denominator *= node - other_node
+
+            for degree, coefficient in enumerate(basis):
+                coefficients[degree] += value * coefficient / denominator
+
+        return FlavorPolynomial(coefficients)
+
+    @property
+    def degree(self):
+        return len(self.coefficients) - 1
+
+    def __call__(self, number_of_flavors):
+        out = sum(
+            coefficient * number_of_flavors ** degree
+            for degree, coefficient in enumerate(self.coefficients)
+        )
+
+        return int(out) if out.denominator == 1 else out
+
+    def __add__(self, other):
+        return FlavorPolynomial(
+            first + second
+            for first, second in itertools.zip_longest(
+                self.coefficients,
+                other.coefficients,
+                fillvalue=0
+            )
+        )
+
+    def __eq__(self, other):
+        return self.coefficients == other.coefficients
+
+    def __hash__(self):
+        return hash(self.coefficients)
+
+    def __str__(self):
+        def term_str(coefficient, degree):
+            if degree == 0:
+                return str(coefficient)
+
+            power = "Nf" if degree == 1 else "Nf^{}".format(degree)
+            if coefficient == 1:
+                return power
+            else:
+                return "{} {}".format(coefficient, power)
+
+        terms = [
+            term_str(coefficient, degree)
+            for degree, coefficient in reversed(list(
+                enumerate(self.coefficients)
+            ))
+            if coefficient != 0
+        ]
+
+        return " + ".join(terms).replace("+ -", "- ") if terms else "0"
+
+    __repr__ = __str__
+
+
+class FlavorInvariants(object):
+    def __init__(self, invariants):
+        self.invariants = invariants
+
+    def __eq__(self, other):
+        return self.invariants == other.invariants
+
+    def __str__(self):
+        return ("\n").join(
+            EFT.Invariants._show_item(polynomial, op, n_derivatives)
+            for op, current_invariants in self.invariants.items()
+            for n_derivatives, polynomial in current_invariants.items()
+        )
+
+    def at(self, number_of_flavors):
+        return EFT.Invariants({
+            operator: {
+                n_derivatives: polynomial(number_of_flavors)
+                for n_derivatives, polynomial in polynomials.items()
+                if polynomial(number_of_flavors) != 0
+            }
+            for operator, polynomials in self.invariants.items()
+        })
+
+    def count(self):
+        return sum(
+            (
+                polynomial
+                for polynomials in self.invariants.values()
+                for polynomial in polynomials.values()
+            ),
+            FlavorPolynomial([])
+        )
+
+
+def _invariants_for_flavors(
+        eft_factory,
+        max_dimension,
+        ignore_lower_dimension,
+        use_eom,
+        number_of_flavors
+):
+    return eft_factory(number_of_flavors).invariants(
+        max_dimension,
+        ignore_lower_dimension=ignore_lower_dimension,
+        use_eom=use_eom
+    ).invariants
+
+
+def max_flavor_degree(eft_factory, max_dimension):
+    flavored_dimensions = [
+        field.dimension
+        for field in eft_factory(2).fields
+        if field.number_of_flavors == 2
+    ]
+
+    if not flavored_dimensions:
+        return 0
+
+    return int(max_dimension // min(flavored_dimensions))
+
+
+def flavor_invariants(
+        eft_factory,
+        max_dimension,
+        ignore_lower_dimension=False,
+        use_eom=True,
+        workers=None,
+        executor=None
+):
+    flavor_numbers = list(
+        range(1, max_flavor_degree(eft_factory, max_dimension) + 2)
+    )
+    function = functools.partial(
+        _invariants_for_flavors,
+        eft_factory,
+        max_dimension,
+        ignore_lower_dimension,
+        use_eom
+    )
+
+    if workers is None and executor is None:
+        results = [
+            function(number_of_flavors)
+            for number_of_flavors in flavor_numbers
+        ]
+    else:
+        results = parallel_map(
+            function,
+            flavor_numbers,
+            flavor_numbers,
+            workers=workers,
+            executor=executor
+        )
+
+    derivatives_by_operator = {}
+    for invariants in results:
+        for operator, counts in invariants.items():
+            derivatives_by_operator.setdefault(operator, set()).update(counts)
+
+    flavor_polynomials = {}
+    for operator, keys in derivatives_by_operator.items():
+        flavor_polynomials[operator] = {
+            n_derivatives: FlavorPolynomial.interpolate({
+                number_of_flavors:
+                invariants.get(operator, {}).get(n_derivatives, 0)
+                for number_of_flavors, invariants
+                in zip(flavor_numbers, results)
+            })
+            for n_derivatives in sorted(keys)
+        }
+
+    return FlavorInvariants(flavor_polynomials)
@@ -0,0 +1,233 @@
+from basisgen.representations import (
+    GradedCharacter, Irrep, ProductPlan, VirtualIrrepCounter
+)
+from basisgen.lorentz import vector
+from basisgen.statistics import Statistics
+
+import collections
+from operator import le
+
+
+class HilbertSeries(object):
+    def __init__(self, fields, max_dimension, use_eom=True, derivatives=None):
+        self.fields = list(fields)
+        self.max_dimension = max_dimension
+        self.use_eom = use_eom
+        self.derivatives = derivatives
+        self.algebra = self.fields[0].irrep.algebra
+        self._field_series = {}
+        self._ceilings = {}
+
+    def max_derivatives(self, dimension):
+        return int(self.max_dimension - dimension)
+
+    def momentum_factor(self, max_grade):
+        internal_singlet = Irrep.singlet(self.algebra[2:])
+
+        return GradedCharacter(
+            {
+                k: (-1) ** k * VirtualIrrepCounter({
+                    lorentz_irrep + internal_singlet: count
+                    for lorentz_irrep, count
+                    in vector.power(k, Statistics.FERMION).items()
+                })
+                for k in range(min(max_grade, 4) + 1)
+            },
+            max_grade
+        )
+
+    def single_particle_states(self, field):
+        max_grade = self.max_derivatives(field.dimension)
+        if self.derivatives is None:
+            tower = field.derivative_tower(max_grade, self.use_eom)
+        else:
+            tower = self.derivatives[field]
+
+        return [
+            (n_derivatives, irrep, count)
+            for n_derivatives in range(max_grade + 1)
+            for irrep, count in collections.Counter(
+                    derived_field.irrep
+                    for derived_field in tower[n_derivatives]
+            ).items()
+        ]
+
+    def field_series(self, field):
+        if field in self._field_series:
+            return self._field_series[field]
+
+        max_exponent = int(self.max_dimension // field.dimension)
+        singlet = VirtualIrrepCounter([Irrep.singlet(self.algebra)])
+        series = {0: {0: singlet}}
+
+        for n_derivatives, irrep, count in self.single_particle_states(field):
+            powers = {0: singlet}
+            new_series = collections.defaultdict(dict)
+
+            for exponent, graded in series.items():
+                for grade, component in graded.items():
+                    for extra in range(max_exponent - exponent + 1):
+                        new_grade = grade + extra * n_derivatives
+                        new_exponent = exponent + extra
+                        if new_grade > self.max_derivatives(
+                                new_exponent * field.dimension
+                        ):
+                            break
+
+                        if extra not in powers:
+                            powers[extra] = VirtualIrrepCounter(
+                                irrep.flavored_power(
+                                    extra,
+                                    field.statistics,
+                                    count * field.number_of_flavors
+                                )
+                            )
+
+                        new_series[new_exponent][new_grade] = (
+                            new_series[new_exponent].get(
+                                new_grade,
+                                VirtualIrrepCounter()
+                            )
+                            + component * powers[extra]
+                        )
+
+            series = new_series
+
+        self._field_series[field] = {
+            exponent: GradedCharacter(
+                graded,
+                self.max_derivatives(exponent * field.dimension)
+            )
+            for exponent, graded in series.items()
+        }
+
+        return self._field_series[field]
+
+    def conjugate_ceiling(self, field, exponent):
+        key = (field, exponent)
+        if key not in self._ceilings:
+            self._ceilings[key] = ProductPlan.root_ceiling(
+                irrep.conjugate
+                for component in self.field_series(field)[
+                        exponent
+                ].components.values()
+                for irrep in component
+            )
+
+        return self._ceilings[key]
+
+    @staticmethod
+    def prune(character, max_grade, ceiling):
+        return GradedCharacter(
+            {
+                grade: VirtualIrrepCounter({
+                    irrep: count
+                    for irrep, count in component.items()
+                    if all(map(le, irrep.root_coordinates, ceiling))
+                })
+                for grade, component in character.components.items()
+            },
+            max_grade
+        )
+
+    @staticmethod
+    def singlets(first, second, max_grade):
+        counts = collections.Counter()
+
+        for first_grade, first_component in first.components.items():
+            for second_grade, second_component in second.components.items():
+                grade = first_grade + second_grade
+                if grade > max_grade:
+                    continue
+
+                counts[grade] += sum(
+                    count * second_component.get(irrep.conjugate, 0)
+                    for irrep, count in first_component.items()
+                )
+
+        return {grade: count for grade, count in counts.items() if count}
+
+    def invariants(self, contents):
+        def dimension(exponents):
+            return sum(
+                exponent * field.dimension
+                for exponent, field in zip(exponents, self.fields)
+            )
+
+        contents = [tuple(content) for content in contents]
+        last_indices = {
+            content: max(
+                index for index, exponent in enumerate(content) if exponent
+            )
+            for content in contents
+        }
+
+        prefix_grades = {}
+        prefix_ceilings = {}
+        for content in contents:
+            max_grade = self.max_derivatives(dimension(content))
+            ceiling = None
+            for length in reversed(range(last_indices[content] + 1)):
+                if content[length]:
+                    field_ceiling = self.conjugate_ceiling(
+                        self.fields[length],
+                        content[length]
+                    )
+                    ceiling = field_ceiling if ceiling is None else (
+                        ProductPlan.add_ceilings(ceiling, field_ceiling)
+                    )
+
+                prefix = content[:length]
+                prefix_grades[prefix] = max(
+                    prefix_grades.get(prefix, -1),
+                    max_grade
+                )
+                prefix_ceilings[prefix] = tuple(map(
+                    max,
+                    prefix_ceilings.get(prefix, ceiling),
+                    ceiling
+                ))
+
+        states = {
+            (): HilbertSeries.prune(
+                self.momentum_factor(prefix_grades[()]),
+                prefix_grades[()],
+                prefix_ceilings[()]
+            )
+        }
+        results = {}
+
+        for index, field in enumerate(self.fields):
+            series = self.field_series(field)
+
+            for content in contents:
+                if last_indices[content] == index:
+                    results[content] = HilbertSeries.singlets(
+                        states[content[:index]],
+                        series[content[index]],
+                        self.max_derivatives(dimension(content))
+                    )
+
+            new_states = {}
+            for prefix, character in states.items():
+                for exponent in range(len(series)):
+                    new_prefix = prefix + (exponent,)
+                    if new_prefix not in prefix_grades:
+                        continue
+
+                    truncated = GradedCharacter(
+                        character.components,
+                        prefix_grades[new_prefix]
+                    )
+                    if exponent:
+                        truncated = truncated * series[exponent]
+
+                    new_states[new_prefix] = HilbertSeries.prune(
+                        truncated,
+                        prefix_grades[new_prefix],
+                        prefix_ceilings[new_prefix]
+                    )
+
+            states = new_states
+
+        return results
@@ -0,0 +1,116 @@
+from concurrent.futures import (
+    FIRST_COMPLETED, ProcessPoolExecutor, as_completed, wait
+)
+import heapq
+import itertools
+import os
+
+
+def balanced_batches(costs, number_of_batches):
+    number_of_batches = max(1, min(number_of_batches, len(costs)))
+    batches = [[] for _ in range(number_of_batches)]
+    loads = [(0, index) for index in range(number_of_batches)]
+
+    by_decreasing_cost = sorted(
+        range(len(costs)),
+        key=lambda index: costs[index],
+        reverse=True
+    )
+
+    for item_index in by_decreasing_cost:
+        load, batch_index = heapq.heappop(loads)
+        batches[batch_index].append(item_index)
+        heapq.heappush(loads, (load + costs[item_index], batch_index))
+
+    return [batch for batch in batches if batch]
+
+
+def _apply_to_batch(function, batch):
+    return [function(item) for item in batch]
+
+
+def parallel_map(
+        function,
+        items,
+        costs,
+        workers=None,
+        executor=None,
+        batches_per_worker=4,
+        callback=None
+):
+    items = list(items)
+    number_of_workers = workers or os.cpu_count() or 1
+    batches = balanced_batches(
+        list(costs),
+        batches_per_worker * number_of_workers
+    )
+    results = [None] * len(items)
+
+    owns_executor = executor is None
+    if owns_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+
+    try:
+        futures = {
+            executor.submit(
+                _apply_to_batch,
+                function,
+                [items[index] for index in batch]
+            ): batch
+            for batch in batches
+        }
+
+        for future in as_completed(futures):
+            for index, result in zip(futures[future], future.result()):
+                results[index] = result
+                if callback is not None:
+                    callback(index, result)
+
+    finally:
+        if owns_executor:
+            executor.shutdown()
+
+    return results
+
+
+def _batches(items, batch_size):
+    iterator = iter(items)
+    while True:
+        batch = list(itertools.islice(iterator, batch_size))
+        if not batch:
+            return
+        yield batch
+
+
+def parallel_imap(
+        function,
+        items,
+        workers=None,
+        executor=None,
+        batch_size=1,
+        max_pending=None
+):
+    number_of_workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or 2 * number_of_workers
+
+    owns_executor = executor is None
+    if owns_executor:
+        executor = ProcessPoolExecutor(max_workers=workers)
+
+    try:
+        pending = {}
+        for batch in _batches(items, batch_size):
+            future = executor.submit(_apply_to_batch, function, batch)
+            pending[future] = batch
+
+            if len(pending) >= max_pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield from zip(pending.pop(future), future.result())
+
+        for future in as_completed(pending):
+            yield from zip(pending[future], future.result())
+
+    finally:
+        if owns_executor:
+            executor.shutdown()
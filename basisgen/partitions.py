@@ -13,3 +13,39 @@ def partitions_generator(n, k):
 @functools.lru_cache(maxsize=None)
 def partitions(n, k):
     return list(partitions_generator(n, k))
+
+
+def integer_partitions_generator(n, largest_part):
+    if n == 0:
+        yield ()
+    else:
+        for part in range(min(n, largest_part), 0, -1):
+            for rest in integer_partitions(n - part, part):
+                yield (part,) + rest
+
+
+@functools.lru_cache(maxsize=None)
+def integer_partitions(n, largest_part=None):
+    if largest_part is None:
+        largest_part = n
+
+    return list(integer_partitions_generator(n, largest_part))
+
+
+def conjugate_partition(partition):
+    return tuple(
+        sum(1 for part in partition if part > index)
+        for index in range(partition[0] if partition else 0)
+    )
+
+
+def hook_content_dimension(partition, n):
+    conjugate = conjugate_partition(partition)
+    numerator, denominator = 1, 1
+
+    for row, part in enumerate(partition):
+        for column in range(part):
+            numerator *= n + column - row
+            denominator *= (part - column) + (conjugate[column] - row) - 1
+
+    return numerator // denominator
@@ -1,11 +1,21 @@
 from basisgen.algebras import SemisimpleAlgebra
 from basisgen.weights import Weight
 from basisgen.statistics import Statistics
-from basisgen.containers import MultivaluedMap, OrderedCounter
+from basisgen.containers import LRUCache, MultivaluedMap, OrderedCounter
+from basisgen.cache import persistent
+from basisgen.partitions import (
+    conjugate_partition, hook_content_dimension, integer_partitions
+)
 
 import collections
 import itertools
 import functools
+from operator import add, ge, le, mul
+
+try:
+    from basisgen.array_weights import ArrayWeightSystem
+except ImportError:
+    ArrayWeightSystem = None
 
 
 class WeightSystem(object):
@@ -92,6 +102,11 @@ class Irrep(object):
             weight=self.highest_weight
         )
 
+    @property
+    @functools.lru_cache(maxsize=None)
+    def signature(self):
+        return "{algebra}{irrep}".format(algebra=self.algebra, irrep=self)
+
     def __add__(self, other):
         return Irrep(
             self.algebra + other.algebra,
@@ -127,11 +142,10 @@ class Irrep(object):
 
     @property
     def conjugate(self):
-        lowest_weight = next(iter(
-            self.weight_system.sorted_weights(self.algebra)
-        ))
-
-        return Irrep(self.algebra, -lowest_weight)
+        return Irrep(
+            self.algebra,
+            self.algebra.dominant_weight(-self.highest_weight)
+        )
 
     @functools.lru_cache(maxsize=None)
     def _mul_semisimple_irreps(self, other):
@@ -153,10 +167,63 @@ class Irrep(object):
 
         return out
 
+    @staticmethod
+    def _racah_speiser(algebra, weights):
+        delta = algebra.sum_of_positive_roots
+        out = collections.Counter()
+
+        for weight, multiplicity in weights:
+            dominant_weight, sign = algebra.reflect_to_dominant(weight + delta)
+            if min(dominant_weight) > 0:
+                out[Irrep(algebra, dominant_weight - delta)] += (
+                    sign * multiplicity
+                )
+
+        return out
+
+    @staticmethod
+    def _array_racah_speiser(algebra, weight_array):
+        return collections.Counter({
+            Irrep(algebra, Weight(highest_weight)): count
+            for highest_weight, count in weight_array.racah_speiser(algebra)
+        })
+
+    @property
+    def _uses_arrays(self):
+        return (
+            ArrayWeightSystem is not None
+            and self.dimension >= ArrayWeightSystem.min_size
+        )
+
+    @property
+    @functools.lru_cache(maxsize=None)
+    def weight_array(self):
+        return ArrayWeightSystem.from_counter(self.weights_with_multiplicities)
+
     @functools.lru_cache(maxsize=None)
+    @persistent('product')
     def _mul_simple_irreps(self, other):
-        product_weight_system = self.weight_system * other.weight_system
-        return product_weight_system.decompose(self.algebra)
+        smaller, larger = sorted(
+            [self, other],
+            key=lambda irrep: irrep.dimension
+        )
+
+        if smaller._uses_arrays:
+            irreps = Irrep._array_racah_speiser(
+                self.algebra,
+                smaller.weight_array.shifted(larger.highest_weight)
+            )
+        else:
+            irreps = Irrep._racah_speiser(
+                self.algebra,
+                (
+                    (weight + larger.highest_weight, multiplicity)
+                    for weight, multiplicity
+                    in smaller.weights_with_multiplicities.items()
+                )
+            )
+
+        return IrrepCounter.sort(+irreps, self.algebra)
 
     def __mul__(self, other):
         if isinstance(other, Irrep):
@@ -173,6 +240,14 @@ class Irrep(object):
     def __getitem__(self, index):
         return Irrep(self.algebra[index], self.highest_weight[index])
 
+    @property
+    def root_coordinates(self):
+        return self.algebra.root_coordinates(self.highest_weight)
+
+    @property
+    def congruence_class(self):
+        return self.algebra.congruence_class(self.highest_weight)
+
     @property
     def is_singlet(self):
         return all(component == 0 for component in self.highest_weight)
@@ -206,17 +281,30 @@ class Irrep(object):
 
         return all_weights
 
-    def _weight_multiplicity(self, level, weight, previous_multiplicities):
-        if level == 0:
+    def _weight_multiplicity(self, weight, dominant_multiplicities):
+        if weight == self.highest_weight:
             return 1
 
         delta = self.algebra.sum_of_positive_roots
 
+        def string_terms(alpha):
+            shifted_weight = weight + alpha
+            while True:
+                multiplicity = dominant_multiplicities.get(
+                    self.algebra.dominant_weight(shifted_weight), 0
+                )
+                if not multiplicity:
+                    return
+
+                yield multiplicity * self.algebra.scalar_product(
+                    shifted_weight, alpha
+                )
+                shifted_weight += alpha
+
         numerator = 2 * sum(
-            previous_multiplicities.get(weight + k*alpha, 0)
-            * self.algebra.scalar_product(weight + k*alpha, alpha)
-            for k in range(1, level + 1)
+            term
             for alpha in Irrep.positive_roots(self.algebra)
+            for term in string_terms(alpha)
         )
 
         denominator = (
@@ -226,19 +314,101 @@ class Irrep(object):
 
         return round(numerator / denominator)
 
+    def _dominant_weights_by_height(self):
+        positive_roots = Irrep.positive_roots(self.algebra)
+        current_weights = {self.highest_weight}
+        all_weights = set(current_weights)
+
+        while current_weights:
+            previous_weights = current_weights
+            current_weights = set()
+
+            for weight in previous_weights:
+                for root in positive_roots:
+                    child_weight = weight - root
+                    is_dominant = min(child_weight) >= 0
+                    if is_dominant and child_weight not in all_weights:
+                        current_weights.add(child_weight)
+
+            all_weights.update(current_weights)
+
+        return sorted(all_weights, key=self.algebra.height, reverse=True)
+
     @property
-    def weights_with_multiplicities(self):
-        multiplicities = collections.Counter()
-
-        for level, weights in self.weights_by_level.items():
-            for weight in weights:
-                multiplicities[weight] = self._weight_multiplicity(
-                    level,
-                    weight,
-                    multiplicities
+    @functools.lru_cache(maxsize=None)
+    @persistent('dominant_weights')
+    def dominant_weights(self):
+        if isinstance(self.algebra, SemisimpleAlgebra):
+            return self._semisimple_dominant_weights
+
+        multiplicities = {}
+        for weight in self._dominant_weights_by_height():
+            multiplicities[weight] = self._weight_multiplicity(
+                weight,
+                multiplicities
+            )
+
+        return [
+            (weight, len(self.algebra.weyl_orbit(weight)), multiplicity)
+            for weight, multiplicity in multiplicities.items()
+            if multiplicity
+        ]
+
+    @property
+    def _semisimple_dominant_weights(self):
+        split_triples = (
+            irrep.dominant_weights for irrep in self.split()
+        )
+
+        return [
+            (
+                self.algebra.join_weights(
+                    weight for weight, _, _ in triples
+                ),
+                functools.reduce(mul, (size for _, size, _ in triples), 1),
+                functools.reduce(mul, (count for _, _, count in triples), 1)
+            )
+            for triples in itertools.product(*split_triples)
+        ]
+
+    @property
+    @functools.lru_cache(maxsize=None)
+    def dimension(self):
+        if isinstance(self.algebra, SemisimpleAlgebra):
+            return functools.reduce(
+                mul,
+                (irrep.dimension for irrep in self.split()),
+                1
+            )
+
+        def scalar_product(weight, root):
+            return sum(map(
+                mul,
+                weight,
+                map(
+                    mul,
+                    self.algebra.root_coordinates(root),
+                    self.algebra.symmetrizer
                 )
+            ))
 
-        return multiplicities
+        delta = self.algebra.sum_of_positive_roots
+        shifted_weight = self.highest_weight + delta
+        numerator = denominator = 1
+
+        for root in Irrep.positive_roots(self.algebra):
+            numerator *= scalar_product(shifted_weight, root)
+            denominator *= scalar_product(delta, root)
+
+        return int(numerator / denominator)
+
+    @property
+    def weights_with_multiplicities(self):
+        return collections.Counter({
+            weight: multiplicity
+            for dominant_weight, _, multiplicity in self.dominant_weights
+            for weight in self.algebra.weyl_orbit(dominant_weight)
+        })
 
     @property
     def _semisimple_weight_system(self):
@@ -273,20 +443,153 @@ class Irrep(object):
         return Irrep.WeightsView([list(weights) for _, weights in groups])
 
     @functools.lru_cache(maxsize=None)
+    def adams_operation(self, k):
+        if isinstance(self.algebra, SemisimpleAlgebra):
+            out = VirtualIrrepCounter()
+            split_operations = (
+                irrep.adams_operation(k).items() for irrep in self.split()
+            )
+
+            for combination in itertools.product(*split_operations):
+                irrep, count = combination[0]
+                for inner_irrep, inner_count in combination[1:]:
+                    irrep += inner_irrep
+                    count *= inner_count
+
+                out[irrep] += count
+
+            return out
+
+        if self._uses_arrays:
+            return VirtualIrrepCounter(Irrep._array_racah_speiser(
+                self.algebra,
+                self.weight_array.scaled(k)
+            ))
+
+        return VirtualIrrepCounter(Irrep._racah_speiser(
+            self.algebra,
+            (
+                (k * weight, multiplicity)
+                for weight, multiplicity
+                in self.weights_with_multiplicities.items()
+            )
+        ))
+
+    @functools.lru_cache(maxsize=None)
+    @persistent('power')
     def power(self, exponent, statistics):
-        combinations_function = {
-            Statistics.BOSON: itertools.combinations_with_replacement,
-            Statistics.FERMION: itertools.combinations
+        if exponent == 0:
+            return IrrepCounter([Irrep.singlet(self.algebra)])
+
+        sign = {
+            Statistics.BOSON: 1,
+            Statistics.FERMION: -1
         }[statistics]
 
-        weights = self.weight_system.weights.elements()
+        newton_sum = VirtualIrrepCounter.sum(
+            sign ** (k - 1)
+            * self.adams_operation(k)
+            * self.power(exponent - k, statistics)
+            for k in range(1, exponent + 1)
+        )
+
+        return IrrepCounter.sort(newton_sum // exponent, self.algebra)
+
+    @functools.lru_cache(maxsize=None)
+    def _power_monomial(self, exponents, statistics):
+        if not exponents:
+            return VirtualIrrepCounter([Irrep.singlet(self.algebra)])
+
+        return (
+            self._power_monomial(exponents[:-1], statistics)
+            * VirtualIrrepCounter(self.power(exponents[-1], statistics))
+        )
 
-        power_weights = (
-            sum(combination, Irrep.singlet(self.algebra).highest_weight)
-            for combination in combinations_function(weights, exponent)
+    @functools.lru_cache(maxsize=None)
+    @persistent('schur_functor')
+    def schur_functor(self, partition):
+        if len(partition) > self.dimension:
+            return IrrepCounter()
+
+        conjugate = conjugate_partition(partition)
+        if len(conjugate) < len(partition):
+            rows, statistics = conjugate, Statistics.FERMION
+        else:
+            rows, statistics = partition, Statistics.BOSON
+
+        coefficients = collections.Counter()
+        for permutation in itertools.permutations(range(len(rows))):
+            exponents = [
+                rows[row] - row + column
+                for row, column in enumerate(permutation)
+            ]
+            if min(exponents) < 0:
+                continue
+
+            inversions = sum(
+                1
+                for first, second in itertools.combinations(permutation, 2)
+                if first > second
+            )
+            monomial = tuple(sorted(
+                exponent for exponent in exponents if exponent > 0
+            ))
+            coefficients[monomial] += (-1) ** inversions
+
+        return IrrepCounter.sort(
+            VirtualIrrepCounter.sum(
+                coefficient * self._power_monomial(monomial, statistics)
+                for monomial, coefficient in coefficients.items()
+                if coefficient
+            ),
+            self.algebra
         )
 
-        return WeightSystem(power_weights).decompose(self.algebra)
+    def flavor_decomposition(
+            self,
+            exponent,
+            statistics,
+            number_of_flavors=None
+    ):
+        out = {}
+        for partition in integer_partitions(exponent):
+            if statistics == Statistics.BOSON:
+                flavor_partition = partition
+            else:
+                flavor_partition = conjugate_partition(partition)
+
+            if (
+                    number_of_flavors is None
+                    or len(flavor_partition) <= number_of_flavors
+            ):
+                out[flavor_partition] = self.schur_functor(partition)
+
+        return out
+
+    @functools.lru_cache(maxsize=None)
+    def flavored_power(self, exponent, statistics, number_of_flavors):
+        if number_of_flavors == 1:
+            return self.power(exponent, statistics)
+
+        decomposition = self.flavor_decomposition(
+            exponent,
+            statistics,
+            number_of_flavors
+        )
+
+        return IrrepCounter.sort(
+            IrrepCounter.sum(
+                IrrepCounter({
+                    irrep: count * hook_content_dimension(
+                        flavor_partition,
+                        number_of_flavors
+                    )
+                    for irrep, count in irreps.items()
+                })
+                for flavor_partition, irreps in decomposition.items()
+            ),
+            self.algebra
+        )
 
 
 class IrrepCounter(collections.Counter):
@@ -322,3 +625,368 @@ class IrrepCounter(collections.Counter):
     @staticmethod
     def sum(irrep_counters):
         return sum(irrep_counters, IrrepCounter())
+
+    @staticmethod
+    def sort(irrep_counter, algebra):
+        def key(pair):
+            highest_weight = pair[0].highest_weight
+            return algebra.height(highest_weight), highest_weight.components
+
+        return IrrepCounter(dict(
+            sorted(irrep_counter.items(), key=key, reverse=True)
+        ))
+
+
+class ProductPlan(object):
+    max_exhaustive_factors = 8
+    partial_products = LRUCache(maxsize=2**14)
+    conjugate_ceilings = LRUCache(maxsize=2**14)
+
+    def __init__(self, factors, keys=None):
+        self.factors = list(factors)
+        self.keys = None if keys is None else list(keys)
+
+        if not all(self.factors):
+            self.order, self.cost = tuple(range(len(self.factors))), 0
+            return
+
+        sizes = [ProductPlan.size(factor) for factor in self.factors]
+        by_decreasing_size = sorted(
+            range(len(sizes)),
+            key=lambda index: sizes[index],
+            reverse=True
+        )
+        order, self.cost = ProductPlan._plan(
+            tuple(sizes[index] for index in by_decreasing_size)
+        )
+        self.order = tuple(by_decreasing_size[index] for index in order)
+
+    def __str__(self):
+        return " x ".join(
+            "[{}]".format(self.factors[index]) for index in self.order
+        )
+
+    __repr__ = __str__
+
+    @staticmethod
+    def size(irrep_counter):
+        return (
+            sum(
+                count * irrep.dimension
+                for irrep, count in irrep_counter.items()
+            ),
+            sum(irrep_counter.values())
+        )
+
+    @staticmethod
+    def product_cost(first_size, second_size):
+        (first_dimension, first_length), (second_dimension, second_length) = (
+            first_size, second_size
+        )
+
+        return first_length * second_length * min(
+            first_dimension / first_length,
+            second_dimension / second_length
+        )
+
+    @staticmethod
+    def _combined_size(sizes):
+        dimension = functools.reduce(mul, (size[0] for size in sizes), 1)
+        average_dimension = max(size[0] / size[1] for size in sizes)
+
+        return dimension, dimension / average_dimension
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _plan(sizes):
+        def extend(plan, index):
+            order, cost = plan
+            return (
+                order + (index,),
+                cost + ProductPlan.product_cost(
+                    ProductPlan._combined_size([
+                        sizes[other_index] for other_index in order
+                    ]),
+                    sizes[index]
+                )
+            )
+
+        if len(sizes) > ProductPlan.max_exhaustive_factors:
+            return functools.reduce(extend, range(1, len(sizes)), ((0,), 0))
+
+        best = {
+            frozenset([index]): ((index,), 0) for index in range(len(sizes))
+        }
+
+        for subset_size in range(2, len(sizes) + 1):
+            for subset in map(
+                    frozenset,
+                    itertools.combinations(range(len(sizes)), subset_size)
+            ):
+                best[subset] = min(
+                    (
+                        extend(best[subset - {index}], index)
+                        for index in subset
+                    ),
+                    key=lambda plan: plan[1]
+                )
+
+        return best[frozenset(range(len(sizes)))]
+
+    @staticmethod
+    def root_ceiling(irreps):
+        return tuple(map(max, zip(*(
+            irrep.root_coordinates for irrep in irreps
+        ))))
+
+    @staticmethod
+    def add_ceilings(first_ceiling, second_ceiling):
+        return tuple(map(add, first_ceiling, second_ceiling))
+
+    @staticmethod
+    def _prefix_keys(keys):
+        counts = collections.Counter()
+        prefix_keys = []
+        for key in keys:
+            counts[key] += 1
+            prefix_keys.append(frozenset(counts.items()))
+
+        return prefix_keys
+
+    def _conjugate_ceilings(self):
+        def conjugate_ceiling(factor):
+            return ProductPlan.root_ceiling(
+                irrep.conjugate for irrep in factor
+            )
+
+        if self.keys is None:
+            return list(map(conjugate_ceiling, self.factors))
+
+        ceilings = []
+        for key, factor in zip(self.keys, self.factors):
+            try:
+                ceiling = ProductPlan.conjugate_ceilings[key]
+            except KeyError:
+                ceiling = conjugate_ceiling(factor)
+                ProductPlan.conjugate_ceilings[key] = ceiling
+
+            ceilings.append(ceiling)
+
+        return ceilings
+
+    def evaluate(self, ceiling=None):
+        def within(irrep, bound):
+            return all(map(le, irrep.root_coordinates, bound))
+
+        def covers(stored_bound, bound):
+            return stored_bound is None or (
+                bound is not None and all(map(ge, stored_bound, bound))
+            )
+
+        def prune(irreps, bound):
+            if bound is None:
+                return irreps
+
+            return IrrepCounter({
+                irrep: count
+                for irrep, count in irreps.items()
+                if within(irrep, bound)
+            })
+
+        if not all(self.factors):
+            return IrrepCounter()
+
+        factors = [self.factors[index] for index in self.order]
+        if self.keys is not None:
+            prefix_keys = ProductPlan._prefix_keys(
+                self.keys[index] for index in self.order
+            )
+
+        bounds = [ceiling] * len(factors)
+        if ceiling is not None:
+            conjugate_ceilings = self._conjugate_ceilings()
+            for index in reversed(range(len(factors) - 1)):
+                bounds[index] = ProductPlan.add_ceilings(
+                    bounds[index + 1],
+                    conjugate_ceilings[self.order[index + 1]]
+                )
+
+        out, start = factors[0], 1
+        if self.keys is not None:
+            for length in reversed(range(2, len(factors) + 1)):
+                try:
+                    stored_bound, irreps = ProductPlan.partial_products[
+                        prefix_keys[length - 1]
+                    ]
+                except KeyError:
+                    continue
+
+                if covers(stored_bound, bounds[length - 1]):
+                    out, start = irreps, length
+                    break
+
+        for index in range(start, len(factors)):
+            out = prune(out, bounds[index - 1]) * factors[index]
+
+            if self.keys is not None:
+                ProductPlan.partial_products[prefix_keys[index]] = (
+                    bounds[index],
+                    out
+                )
+
+        return out
+
+
+class VirtualIrrepCounter(collections.Counter):
+    __str__ = IrrepCounter.__str__
+    __repr__ = __str__
+
+    def _without_zeros(self):
+        return VirtualIrrepCounter({
+            irrep: count for irrep, count in self.items() if count
+        })
+
+    def __add__(self, other):
+        out = VirtualIrrepCounter(self)
+        out.update(other)
+        return out._without_zeros()
+
+    def __sub__(self, other):
+        out = VirtualIrrepCounter(self)
+        out.subtract(other)
+        return out._without_zeros()
+
+    def __neg__(self):
+        return VirtualIrrepCounter({
+            irrep: -count for irrep, count in self.items()
+        })
+
+    def __mul__(self, other):
+        if isinstance(other, int):
+            return VirtualIrrepCounter({
+                irrep: other * count for irrep, count in self.items()
+            })._without_zeros()
+
+        out = VirtualIrrepCounter()
+
+        for first_irrep, first_count in self.items():
+            for second_irrep, second_count in other.items():
+                for irrep, count in (first_irrep * second_irrep).items():
+                    out[irrep] += count * first_count * second_count
+
+        return out._without_zeros()
+
+    __rmul__ = __mul__
+
+    def __floordiv__(self, divisor):
+        return VirtualIrrepCounter({
+            irrep: count // divisor for irrep, count in self.items()
+        })
+
+    @staticmethod
+    def sum(irrep_counters):
+        return sum(irrep_counters, VirtualIrrepCounter())
+
+
+class GradedCharacter(object):
+    def __init__(self, components, max_grade):
+        self.max_grade = max_grade
+        self.components = {
+            grade: component
+            for grade, component in components.items()
+            if grade <= max_grade and component
+        }
+
+    def __str__(self):
+        return " + ".join(
+            "t^{}({})".format(grade, component)
+            for grade, component in sorted(self.components.items())
+        )
+
+    __repr__ = __str__
+
+    @staticmethod
+    def one(algebra, max_grade):
+        return GradedCharacter(
+            {0: VirtualIrrepCounter([Irrep.singlet(algebra)])},
+            max_grade
+        )
+
+    def __add__(self, other):
+        components = dict(self.components)
+        for grade, component in other.components.items():
+            components[grade] = (
+                components.get(grade, VirtualIrrepCounter()) + component
+            )
+
+        return GradedCharacter(
+            components,
+            min(self.max_grade, other.max_grade)
+        )
+
+    def __mul__(self, other):
+        if isinstance(other, int):
+            return GradedCharacter(
+                {
+                    grade: other * component
+                    for grade, component in self.components.items()
+                },
+                self.max_grade
+            )
+
+        max_grade = min(self.max_grade, other.max_grade)
+        components = {}
+
+        for first_grade, first_component in self.components.items():
+            for second_grade, second_component in other.components.items():
+                grade = first_grade + second_grade
+                if grade <= max_grade:
+                    components[grade] = (
+                        components.get(grade, VirtualIrrepCounter())
+                        + first_component * second_component
+                    )
+
+        return GradedCharacter(components, max_grade)
+
+    __rmul__ = __mul__
+
+    def __floordiv__(self, divisor):
+        return GradedCharacter(
+            {
+                grade: component // divisor
+                for grade, component in self.components.items()
+            },
+            self.max_grade
+        )
+
+    def adams_operation(self, k):
+        return GradedCharacter(
+            {
+                k * grade: VirtualIrrepCounter.sum(
+                    count * irrep.adams_operation(k)
+                    for irrep, count in component.items()
+                )
+                for grade, component in self.components.items()
+                if k * grade <= self.max_grade
+            },
+            self.max_grade
+        )
+
+    def power(self, exponent, statistics, algebra, multiplicity=1):
+        sign = {
+            Statistics.BOSON: 1,
+            Statistics.FERMION: -1
+        }[statistics]
+
+        powers = [GradedCharacter.one(algebra, self.max_grade)]
+        for n in range(1, exponent + 1):
+            newton_sum = GradedCharacter({}, self.max_grade)
+            for k in range(1, n + 1):
+                newton_sum += (
+                    sign ** (k - 1) * multiplicity
+                    * self.adams_operation(k) * powers[n - k]
+                )
+
+            powers.append(newton_sum // n)
+
+        return powers[exponent]
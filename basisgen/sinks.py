@@ -0,0 +1,61 @@
+import csv
+import json
+
+
+class Sink(object):
+    def __init__(self, file):
+        if isinstance(file, str):
+            self.file = open(file, 'w', newline='')
+            self.owns_file = True
+        else:
+            self.file = file
+            self.owns_file = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exception_info):
+        self.close()
+
+    def write(self, operator, invariants):
+        raise NotImplementedError
+
+    def close(self):
+        if self.owns_file:
+            self.file.close()
+
+
+class JSONLinesSink(Sink):
+    def write(self, operator, invariants):
+        record = {
+            'operator': str(operator),
+            'content': {
+                str(field): exponent
+                for field, exponent in operator.content.items()
+            },
+            'dimension': operator.dimension,
+            'invariants': {
+                str(n_derivatives): count
+                for n_derivatives, count in invariants.items()
+            }
+        }
+
+        self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+
+
+class CSVSink(Sink):
+    header = ['operator', 'dimension', 'number_of_derivatives', 'count']
+
+    def __init__(self, file):
+        super().__init__(file)
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(CSVSink.header)
+
+    def write(self, operator, invariants):
+        for n_derivatives, count in invariants.items():
+            self.writer.writerow(
+                [operator, operator.dimension, n_derivatives, count]
+            )
+
+        self.file.flush()
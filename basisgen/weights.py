@@ -1,6 +1,33 @@
+from operator import add, neg, sub
+
+
+def _components(weight):
+    if isinstance(weight, Weight):
+        return weight.components
+    else:
+        return tuple(weight)
+
+
 class Weight(object):
+    __slots__ = ('components', '_hash')
+
     def __init__(self, components):
         self.components = tuple(components)
+        self._hash = None
+
+    @staticmethod
+    def _from_tuple(components):
+        weight = object.__new__(Weight)
+        weight.components = components
+        weight._hash = None
+        return weight
+
+    def __reduce__(self):
+        return Weight, (self.components,)
+
+    def __setstate__(self, state):
+        self.components = tuple(state['components'])
+        self._hash = None
 
     def __str__(self):
         return "({})".format(
@@ -10,22 +37,29 @@ class Weight(object):
     __repr__ = __str__
 
     def __hash__(self):
-        return hash(self.components)
+        if self._hash is None:
+            self._hash = hash(self.components)
+
+        return self._hash
 
     def __eq__(self, other):
-        return self.components == other.components
+        return self is other or self.components == other.components
 
     def __add__(self, other):
-        return Weight(x + y for x, y in zip(self, other))
+        return Weight._from_tuple(
+            tuple(map(add, self.components, _components(other)))
+        )
 
     def __neg__(self):
-        return Weight(-x for x in self)
+        return Weight._from_tuple(tuple(map(neg, self.components)))
 
     def __sub__(self, other):
-        return Weight(x - y for x, y in zip(self, other))
+        return Weight._from_tuple(
+            tuple(map(sub, self.components, _components(other)))
+        )
 
     def __mul__(self, other):
-        return Weight(tuple(other * x for x in self))
+        return Weight._from_tuple(tuple([other * x for x in self.components]))
 
     __rmul__ = __mul__
 
@@ -34,7 +68,7 @@ class Weight(object):
 
     def __getitem__(self, key):
         if isinstance(key, slice):
-            return Weight(self.components[key])
+            return Weight._from_tuple(self.components[key])
         else:
             return self.components[key]
 
@@ -42,4 +76,4 @@ class Weight(object):
         return len(self.components)
 
     def concat(self, other):
-        return Weight(self.components + other.components)
+        return Weight._from_tuple(self.components + other.components)
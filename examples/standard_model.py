@@ -60,6 +60,22 @@ def parse_arguments():
         const=True
     )
 
+    argument_parser.add_argument(
+        '--workers',
+        type=int,
+        metavar='N',
+        default=None,
+        help='Number of worker processes (default: run serially)'
+    )
+
+    argument_parser.add_argument(
+        '--checkpoint',
+        metavar='DIRECTORY',
+        default=None,
+        help='Directory where finished operators are recorded, so that an '
+        'interrupted run can be resumed'
+    )
+
     return argument_parser.parse_args()
 
 
@@ -84,7 +100,9 @@ if __name__ == '__main__':
         arguments.dimension,
         verbose=True,
         ignore_lower_dimension=not arguments.include_lower_dimension,
-        use_eom=not arguments.no_eom
+        use_eom=not arguments.no_eom,
+        workers=arguments.workers,
+        checkpoint=arguments.checkpoint
     )
 
     if arguments.profile:
@@ -1,6 +1,7 @@
 from basisgen.algebras import Series, SimpleAlgebra, SemisimpleAlgebra
 from basisgen.weights import Weight
 
+from fractions import Fraction
 import unittest
 
 
@@ -209,6 +210,21 @@ class TestSimpleAlgebra(unittest.TestCase):
         for algebra, metric in known_metrics.items():
             self.assertEqual(algebra.metric, metric)
 
+    def test_congruence_class(self):
+        self.assertEqual(
+            self.a2.congruence_class(Weight([1, 0])),
+            (Fraction(2, 3), Fraction(1, 3))
+        )
+        self.assertEqual(self.a2.congruence_class(Weight([1, 1])), (0, 0))
+        self.assertEqual(self.a2.congruence_class(Weight([3, 0])), (0, 0))
+        self.assertTrue(any(self.e6.congruence_class(
+            Weight([1, 0, 0, 0, 0, 0])
+        )))
+        self.assertFalse(any(self.e8.congruence_class(
+            Weight([0, 0, 0, 0, 0, 0, 1, 0])
+        )))
+        self.assertFalse(any(self.g2.congruence_class(Weight([1, 0]))))
+
 
 class TestSemisimpleAlgebra(unittest.TestCase):
     def setUp(self):
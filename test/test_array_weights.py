@@ -0,0 +1,64 @@
+from basisgen.algebras import Series, SimpleAlgebra
+from basisgen.representations import Irrep
+from basisgen.weights import Weight
+
+import unittest
+
+try:
+    from basisgen.array_weights import ArrayWeightSystem
+except ImportError:
+    ArrayWeightSystem = None
+
+
+@unittest.skipIf(ArrayWeightSystem is None, "numpy is not installed")
+class TestArrayWeightSystem(unittest.TestCase):
+    def setUp(self):
+        self.algebra = SimpleAlgebra(Series.A, 4)
+        self.adjoint = Irrep(self.algebra, Weight([1, 0, 0, 1]))
+        self.irrep = Irrep(self.algebra, Weight([0, 1, 1, 0]))
+
+    def test_conversion(self):
+        self.assertEqual(
+            dict(self.irrep.weight_array),
+            {
+                weight.components: count
+                for weight, count
+                in self.irrep.weights_with_multiplicities.items()
+            }
+        )
+
+    def test_racah_speiser(self):
+        self.assertTrue(self.irrep._uses_arrays)
+
+        shifted_weights = self.irrep.weight_array.shifted(
+            self.adjoint.highest_weight
+        )
+        self.assertEqual(
+            Irrep._array_racah_speiser(self.algebra, shifted_weights),
+            +Irrep._racah_speiser(
+                self.algebra,
+                (
+                    (weight + self.adjoint.highest_weight, count)
+                    for weight, count
+                    in self.irrep.weights_with_multiplicities.items()
+                )
+            )
+        )
+        self.assertEqual(
+            Irrep._array_racah_speiser(
+                self.algebra,
+                self.irrep.weight_array.scaled(3)
+            ),
+            Irrep._racah_speiser(
+                self.algebra,
+                (
+                    (3 * weight, count)
+                    for weight, count
+                    in self.irrep.weights_with_multiplicities.items()
+                )
+            )
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
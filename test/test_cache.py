@@ -0,0 +1,53 @@
+from basisgen import cache
+from basisgen.algebras import Series, SimpleAlgebra
+from basisgen.representations import Irrep
+from basisgen.statistics import Statistics
+from basisgen.weights import Weight
+
+import os
+import tempfile
+import unittest
+
+
+class TestPersistentCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'cache.sqlite')
+
+    def tearDown(self):
+        cache.disable()
+        self.directory.cleanup()
+
+    def test_storage(self):
+        persistent_cache = cache.PersistentCache(self.path)
+        persistent_cache['key'] = {'value': 1}
+
+        self.assertEqual(
+            cache.PersistentCache(self.path)['key'],
+            {'value': 1}
+        )
+        with self.assertRaises(KeyError):
+            persistent_cache['missing key']
+
+        newer_cache = cache.PersistentCache(self.path)
+        newer_cache.version = cache.PersistentCache.version + 1
+        with self.assertRaises(KeyError):
+            newer_cache['key']
+
+    def test_power_is_stored(self):
+        cache.enable(self.path)
+        irrep = Irrep(SimpleAlgebra(Series.C, 3), Weight([0, 0, 1]))
+        Irrep.power.cache_clear()
+
+        power = irrep.power(2, Statistics.FERMION)
+
+        self.assertEqual(
+            cache.PersistentCache(self.path)[
+                'power:C3[0 0 1]:2:Statistics.FERMION'
+            ],
+            power
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+from basisgen.checkpoints import Checkpoint
+from basisgen.eft import EFT
+from basisgen.smeft import sm_gauge_algebra, phi, phic
+
+import os
+import tempfile
+import unittest
+
+
+class TestCheckpoint(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.eft = EFT(sm_gauge_algebra, [phi, phic])
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def checkpoint_path(self):
+        [file_name] = os.listdir(self.directory.name)
+        return os.path.join(self.directory.name, file_name)
+
+    def test_records_are_reused(self):
+        invariants = self.eft.invariants(6, checkpoint=self.directory.name)
+        checkpoint = Checkpoint(self.checkpoint_path())
+
+        self.assertEqual(
+            set(checkpoint.results),
+            set(map(str, invariants.invariants))
+        )
+        self.assertEqual(
+            self.eft.invariants(6, checkpoint=self.directory.name),
+            invariants
+        )
+
+    def test_truncated_checkpoint(self):
+        invariants = self.eft.invariants(6, checkpoint=self.directory.name)
+
+        path = self.checkpoint_path()
+        with open(path, 'r+b') as checkpoint_file:
+            checkpoint_file.truncate(os.path.getsize(path) - 3)
+
+        self.assertEqual(len(Checkpoint(path).results), 2)
+        self.assertEqual(
+            self.eft.invariants(6, checkpoint=self.directory.name),
+            invariants
+        )
+        self.assertEqual(len(Checkpoint(path).results), 3)
+
+    def test_options_are_part_of_the_key(self):
+        self.eft.invariants(4, checkpoint=self.directory.name)
+        self.eft.invariants(6, checkpoint=self.directory.name)
+
+        self.assertEqual(len(os.listdir(self.directory.name)), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
 from basisgen.algebras import Series, SimpleAlgebra
-from basisgen.representations import Irrep
+from basisgen.partitions import hook_content_dimension
+from basisgen.representations import Irrep, IrrepCounter, ProductPlan
+from basisgen.statistics import Statistics
 from basisgen.weights import Weight
 
 import unittest
@@ -58,6 +60,55 @@ class TestIrrep(unittest.TestCase):
         for irrep, weights in known_weights.items():
             self.assertEqual(irrep.weight_system.weights, weights)
 
+    def test_dominant_weights(self):
+        octet = Irrep(SimpleAlgebra(Series.A, 2), Weight([1, 1]))
+
+        self.assertEqual(
+            octet.dominant_weights,
+            [(Weight([1, 1]), 6, 1), (Weight([0, 0]), 1, 2)]
+        )
+
+    def test_dimensions(self):
+        known_dimensions = {
+            Irrep(SimpleAlgebra(Series.B, 3), Weight([0, 0, 1])): 8,
+            Irrep(SimpleAlgebra(Series.D, 5), Weight([0, 0, 0, 0, 1])): 16,
+            Irrep(SimpleAlgebra(Series.G, 2), Weight([0, 1])): 7,
+            Irrep(SimpleAlgebra(Series.F, 4), Weight([0, 0, 0, 1])): 26,
+            Irrep(
+                SimpleAlgebra(Series.E, 7),
+                Weight([0, 0, 0, 0, 0, 1, 0])
+            ): 56,
+            Irrep(
+                SimpleAlgebra(Series.E, 8),
+                Weight([0, 0, 0, 0, 0, 0, 1, 0])
+            ): 248,
+        }
+
+        for irrep, dimension in known_dimensions.items():
+            self.assertEqual(irrep.dimension, dimension)
+            self.assertEqual(
+                sum(irrep.weights_with_multiplicities.values()),
+                dimension
+            )
+
+    def test_large_dimensions(self):
+        for irrep in [
+                Irrep(SimpleAlgebra(Series.B, 4), Weight([2, 2, 2, 2])),
+                Irrep(SimpleAlgebra(Series.F, 4), Weight([1, 1, 1, 1])),
+        ]:
+            self.assertEqual(
+                irrep.dimension,
+                sum(size * count for _, size, count in irrep.dominant_weights)
+            )
+
+        self.assertEqual(
+            Irrep(SimpleAlgebra(Series.A, 20), Weight([40] * 20)).dimension,
+            hook_content_dimension(
+                tuple(40 * row for row in range(20, 0, -1)),
+                21
+            )
+        )
+
     def test_su3_tensor_products(self):
         SU3_algebra = SimpleAlgebra(Series.A, 2)
 
@@ -124,6 +175,138 @@ class TestIrrep(unittest.TestCase):
         for product, decomposition in known_decompositions:
             self.assertEqual(product, collections.Counter(decomposition))
 
+    def test_exceptional_tensor_products(self):
+        G2_algebra = SimpleAlgebra(Series.G, 2)
+        E6_algebra = SimpleAlgebra(Series.E, 6)
+
+        known_decompositions = [
+            (
+                Irrep(G2_algebra, Weight([0, 1]))
+                * Irrep(G2_algebra, Weight([0, 1])),
+                [
+                    Irrep(G2_algebra, Weight([0, 0])),
+                    Irrep(G2_algebra, Weight([0, 1])),
+                    Irrep(G2_algebra, Weight([1, 0])),
+                    Irrep(G2_algebra, Weight([0, 2]))
+                ]
+            ),
+            (
+                Irrep(E6_algebra, Weight([1, 0, 0, 0, 0, 0]))
+                * Irrep(E6_algebra, Weight([0, 0, 0, 0, 1, 0])),
+                [
+                    Irrep(E6_algebra, Weight([0, 0, 0, 0, 0, 0])),
+                    Irrep(E6_algebra, Weight([0, 0, 0, 0, 0, 1])),
+                    Irrep(E6_algebra, Weight([1, 0, 0, 0, 1, 0]))
+                ]
+            )
+        ]
+
+        for product, decomposition in known_decompositions:
+            self.assertEqual(product, collections.Counter(decomposition))
+
+    def test_powers(self):
+        SU3_algebra = SimpleAlgebra(Series.A, 2)
+        octet = Irrep(SU3_algebra, Weight([1, 1]))
+
+        self.assertEqual(
+            octet.power(2, Statistics.BOSON),
+            collections.Counter([
+                Irrep(SU3_algebra, Weight([0, 0])),
+                octet,
+                Irrep(SU3_algebra, Weight([2, 2]))
+            ])
+        )
+        self.assertEqual(
+            octet.power(2, Statistics.FERMION),
+            collections.Counter([
+                octet,
+                Irrep(SU3_algebra, Weight([3, 0])),
+                Irrep(SU3_algebra, Weight([0, 3]))
+            ])
+        )
+        self.assertEqual(octet.power(9, Statistics.FERMION), {})
+
+        SU5_adjoint = Irrep(SimpleAlgebra(Series.A, 4), Weight([1, 0, 0, 1]))
+        self.assertEqual(
+            sum(
+                irrep.dimension * count
+                for irrep, count
+                in SU5_adjoint.power(6, Statistics.BOSON).items()
+            ),
+            475020
+        )
+
+    def test_flavored_powers(self):
+        SU3_algebra = SimpleAlgebra(Series.A, 2)
+        triplet = Irrep(SU3_algebra, Weight([1, 0]))
+
+        self.assertEqual(
+            triplet.schur_functor((2, 1)),
+            collections.Counter([Irrep(SU3_algebra, Weight([1, 1]))])
+        )
+        self.assertEqual(
+            triplet.flavor_decomposition(3, Statistics.FERMION, 2),
+            {
+                (2, 1): triplet.schur_functor((2, 1)),
+                (3,): triplet.schur_functor((1, 1, 1))
+            }
+        )
+
+        for statistics in Statistics:
+            two_flavors = sum(
+                (
+                    triplet.power(exponent, statistics)
+                    * triplet.power(3 - exponent, statistics)
+                    for exponent in range(4)
+                ),
+                IrrepCounter()
+            )
+            self.assertEqual(
+                triplet.flavored_power(3, statistics, 2),
+                two_flavors
+            )
+
+    def test_product_plan(self):
+        SU3_algebra = SimpleAlgebra(Series.A, 2)
+        factors = [
+            IrrepCounter([Irrep(SU3_algebra, Weight([2, 2]))]),
+            IrrepCounter([Irrep(SU3_algebra, Weight([1, 0]))]),
+            IrrepCounter([Irrep(SU3_algebra, Weight([3, 1]))]),
+            IrrepCounter([Irrep(SU3_algebra, Weight([0, 1]))]),
+        ]
+        plan = ProductPlan(factors)
+
+        self.assertEqual(plan.order, (3, 1, 2, 0))
+
+        singlet = Irrep(SU3_algebra, Weight([0, 0]))
+        pruned = plan.evaluate(singlet.root_coordinates)
+        self.assertEqual(pruned[singlet], plan.evaluate()[singlet])
+        self.assertLess(len(pruned), len(plan.evaluate()))
+        self.assertEqual(
+            plan.evaluate(),
+            factors[0] * factors[1] * factors[2] * factors[3]
+        )
+
+    def test_partial_products(self):
+        SU3_algebra = SimpleAlgebra(Series.A, 2)
+        triplet = IrrepCounter([Irrep(SU3_algebra, Weight([1, 0]))])
+        antitriplet = IrrepCounter([Irrep(SU3_algebra, Weight([0, 1]))])
+        octet = IrrepCounter([Irrep(SU3_algebra, Weight([1, 1]))])
+
+        ProductPlan.partial_products.clear()
+        ProductPlan(
+            [triplet, antitriplet],
+            keys=['3', '3*']
+        ).evaluate()
+        self.assertEqual(len(ProductPlan.partial_products), 1)
+
+        plan = ProductPlan(
+            [antitriplet, octet, triplet],
+            keys=['3*', '8', '3']
+        )
+        self.assertEqual(plan.evaluate(), triplet * antitriplet * octet)
+        self.assertEqual(len(ProductPlan.partial_products), 2)
+
     def test_positive_roots(self):
         known_positive_roots = {
             SimpleAlgebra(Series.A, 2): {
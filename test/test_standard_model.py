@@ -1,7 +1,18 @@
 from basisgen.eft import Operator, EFT
-from basisgen.smeft import sm_gauge_algebra, smeft, phi, phic, u, uc, GL, GR
+from basisgen.flavors import FlavorPolynomial, flavor_invariants
+from basisgen.lorentz import lorentz_algebra
+from basisgen.representations import Irrep, IrrepCounter, ProductPlan
+from basisgen.smeft import (
+    sm_gauge_algebra, smeft, phi, phic, u, uc, d, dc, GL, GR, WL
+)
+from basisgen.sinks import JSONLinesSink, Sink
 from basisgen.weights import Weight
 
+from concurrent.futures import ThreadPoolExecutor
+from fractions import Fraction
+import io
+import json
+import pickle
 import unittest
 from collections import Counter
 
@@ -34,8 +45,283 @@ class TestSMEFT(unittest.TestCase):
             invariants
         )
 
+    def test_hilbert_series(self):
+        for dimension in [5, 6, 7]:
+            self.assertEqual(
+                smeft(1).hilbert_series(
+                    dimension, ignore_lower_dimension=True
+                ),
+                smeft(1).invariants(dimension, ignore_lower_dimension=True)
+            )
+
+        higgs_only = EFT(sm_gauge_algebra, [phi, phic])
+        series = higgs_only.hilbert_series(8).invariants
+        invariants = higgs_only.invariants(8).invariants
+
+        self.assertEqual(series.pop(phi * phic), {0: 1, 2: -1})
+        self.assertEqual(invariants.pop(phi * phic), {0: 1})
+        self.assertEqual(series, invariants)
+
+    def test_parallel_execution(self):
+        serial_invariants = smeft(1).invariants(5)
+        parallel_invariants = smeft(1).invariants(5, workers=2)
+
+        self.assertEqual(parallel_invariants, serial_invariants)
+        self.assertEqual(str(parallel_invariants), str(serial_invariants))
+
+        higgs_only = EFT(sm_gauge_algebra, [phi, phic])
+        self.assertEqual(
+            str(higgs_only.covariants(3, workers=2)),
+            str(higgs_only.covariants(3))
+        )
+
+    def test_iter_invariants(self):
+        output = io.StringIO()
+        higgs_only = EFT(sm_gauge_algebra, [phi, phic])
+
+        streamed_invariants = dict(
+            higgs_only.iter_invariants(6, sinks=[JSONLinesSink(output)])
+        )
+
+        self.assertEqual(
+            EFT.Invariants(streamed_invariants),
+            higgs_only.invariants(6)
+        )
+        self.assertEqual(
+            [json.loads(line) for line in output.getvalue().splitlines()][1],
+            {
+                'operator': '(phi)^2 (phi*)^2',
+                'content': {'phi': 2, 'phi*': 2},
+                'dimension': 4,
+                'invariants': {'0': 1, '2': 2}
+            }
+        )
+        with self.assertRaises(NotImplementedError):
+            list(higgs_only.iter_invariants(4, sinks=[Sink(io.StringIO())]))
+
+    def test_parallel_iter_invariants(self):
+        class CountingExecutor(ThreadPoolExecutor):
+            submitted = 0
+
+            def submit(self, function, apply, batch):
+                CountingExecutor.submitted += len(batch)
+                return super().submit(function, apply, batch)
+
+        sm = smeft(1)
+        with CountingExecutor(max_workers=2) as executor:
+            streamed_invariants = dict(
+                sm.iter_invariants(6, executor=executor)
+            )
+
+        self.assertEqual(EFT.Invariants(streamed_invariants), sm.invariants(6))
+        self.assertEqual(
+            CountingExecutor.submitted,
+            len(set(
+                operator.canonical_structure(use_eom=True)
+                for operator in streamed_invariants
+            ))
+        )
+
+    def test_neutral_operators(self):
+        sm = smeft(1)
+
+        self.assertEqual(
+            list(sm.operators(6, neutral_only=True)),
+            [operator for operator in sm.operators(6) if operator.is_neutral]
+        )
+        self.assertEqual(
+            EFT.charge_lattice([phi, phic, u(1), uc(1)]),
+            [(3,), (-3,), (4,), (-4,)]
+        )
+
+    def test_congruence_filter(self):
+        operator = u(1) * u(1) * uc(1) * phi
+
+        self.assertTrue((u(1) * uc(1) * phi * phic).admits_singlets(8))
+        self.assertFalse(operator.admits_singlets(8))
+        self.assertFalse(any(
+            irrep.is_singlet
+            for irreps in operator.irreps_without_total_derivatives(
+                    8, use_eom=True
+            ).values()
+            for irrep in irreps
+        ))
+
+    def test_singlet_sources(self):
+        operator = u(1) * uc(1) * GL * GR
+        sources = operator.singlet_sources_with_derivatives(8, use_eom=True)
+        irreps = operator.irreps_with_derivatives(8, True, use_eom=True)
+
+        for n_derivatives, counter in sources.items():
+            targets = Operator.singlet_sources(
+                lorentz_algebra + sm_gauge_algebra,
+                2 - n_derivatives
+            )
+            self.assertEqual(
+                counter,
+                IrrepCounter({
+                    irrep: count
+                    for irrep, count in irreps[n_derivatives].items()
+                    if irrep in targets
+                })
+            )
+
+    def test_structural_cache(self):
+        up_operator = u(1) * uc(1) * GL * GR
+        down_operator = d(1) * dc(1) * GL * GR
+
+        self.assertEqual(up_operator.structure(), down_operator.structure())
+        self.assertNotEqual(
+            (u(1) * d(1) * GL).structure(),
+            (u(1)**2 * GL).structure()
+        )
+
+        Operator.results_by_structure.clear()
+        self.assertEqual(
+            up_operator.invariants(8),
+            down_operator.invariants(8)
+        )
+        self.assertEqual(len(Operator.results_by_structure), 1)
+
+    def test_renamed_fields_share_partial_products(self):
+        up_operator = u(1)**2 * uc(1) * phi
+        down_operator = d(1)**2 * dc(1) * phi
+
+        self.assertIs(
+            Operator.field_power_levels(u(1), 2, 3, True),
+            Operator.field_power_levels(d(1), 2, 3, True)
+        )
+
+        ProductPlan.partial_products.clear()
+        up_operator.irreps_with_derivatives(8, False, True)
+        stored_products = len(ProductPlan.partial_products)
+        down_operator.irreps_with_derivatives(8, False, True)
+
+        self.assertTrue(stored_products)
+        self.assertEqual(len(ProductPlan.partial_products), stored_products)
+
+    def test_conjugate_operators(self):
+        operator = u(1) * dc(1) * GL * phi
+        conjugate = uc(1) * d(1) * GR * phic
+
+        self.assertEqual(
+            operator.conjugate.structure(use_eom=True),
+            conjugate.structure(use_eom=True)
+        )
+        self.assertEqual(
+            operator.canonical_structure(use_eom=True),
+            conjugate.canonical_structure(use_eom=True)
+        )
+        self.assertNotEqual(
+            operator.canonical_structure(use_eom=False),
+            conjugate.canonical_structure(use_eom=False)
+        )
+        self.assertEqual(
+            operator._invariants(8, False, use_eom=True),
+            conjugate._invariants(8, False, use_eom=True)
+        )
+
+    def test_invariants_sweep(self):
+        sm = smeft(1)
+        sweep = dict(sm.invariants_sweep(range(4, 8)))
+
+        self.assertEqual(list(sweep), [4, 5, 6, 7])
+        for dimension, invariants in sweep.items():
+            self.assertEqual(invariants, smeft(1).invariants(dimension))
+        self.assertTrue(sm.cached_results)
+
+    def test_total_derivatives(self):
+        algebra = lorentz_algebra + sm_gauge_algebra
+        scalar_singlet = Irrep.singlet(algebra)
+        tower = Operator.total_derivatives(scalar_singlet, 2, 1)
+
+        self.assertEqual(
+            tower,
+            {
+                2: IrrepCounter([Irrep(algebra, Weight([1, 1, 0, 0, 0]))]),
+                3: IrrepCounter([
+                    Irrep(algebra, Weight([2, 2, 0, 0, 0])),
+                    scalar_singlet
+                ])
+            }
+        )
+        self.assertIs(
+            tower[3],
+            Operator.total_derivatives(scalar_singlet, 3, 0)[2]
+        )
+
+    def test_counting_derivatives(self):
+        operators = [
+            phi**2 * phic**2,
+            u(1) * uc(1) * GL * GR,
+            u(3)**2 * uc(3)**2,
+            phi**3 * phic * WL
+        ]
+
+        for operator in operators:
+            for use_eom in [True, False]:
+                explicit_irreps = operator.irreps_with_derivatives(
+                    8, True, use_eom, counting=False
+                )
+
+                self.assertEqual(
+                    operator.irreps_with_derivatives(8, False, use_eom),
+                    operator.irreps_with_derivatives(
+                        8, False, use_eom, counting=False
+                    )
+                )
+                self.assertEqual(
+                    operator._invariants(8, False, use_eom),
+                    operator.invariants_from_sources(explicit_irreps, 8)
+                )
+
+    def test_flavor_polynomials(self):
+        invariants = flavor_invariants(smeft, 5, workers=2)
+
+        self.assertEqual(invariants.at(3), smeft(3).invariants(5))
+        self.assertEqual(invariants.count()(1), 16)
+        self.assertEqual(
+            FlavorPolynomial.interpolate({1: 1, 2: 3, 3: 6}),
+            FlavorPolynomial([0, Fraction(1, 2), Fraction(1, 2)])
+        )
+
+    def test_interned_fields(self):
+        operator = u(1) * uc(1) * phi
+        flavored_operator = phi * uc(3) * u(3)
+
+        self.assertIs(phi.differentiate(1), phi.differentiate(1))
+        self.assertEqual(u(1).id, u(3).id)
+        self.assertNotEqual(u(1).id, uc(1).id)
+        self.assertEqual(operator, flavored_operator)
+        self.assertEqual(hash(operator), hash(flavored_operator))
+        self.assertEqual(pickle.loads(pickle.dumps(operator)), operator)
+        self.assertEqual(pickle.loads(pickle.dumps(phi)).id, phi.id)
+
+        with self.assertRaises(TypeError):
+            operator.content[phi] += 1
+        self.assertEqual(operator, flavored_operator)
+
+    def test_derivative_table(self):
+        higgs_only = EFT(sm_gauge_algebra, [phi, phic])
+        table = higgs_only.derivative_table(6, use_eom=False)
+        operator = phi**2 * phic**2
+
+        self.assertEqual(list(table[phi]), [0, 1, 2, 3, 4, 5])
+        self.assertEqual(table[phi][2], phi.differentiate(2, use_eom=False))
+        self.assertIs(table, higgs_only.derivative_table(6, use_eom=False))
+        self.assertEqual(
+            operator.irreps_with_derivatives(
+                6, False, False, counting=False, derivatives=table
+            ),
+            operator.irreps_with_derivatives(6, False, False)
+        )
+
     def test_3_flavors(self):
         self.assertEqual(smeft(3).invariants(4).count(), 62)
+        self.assertEqual(
+            smeft(3).invariants(6, ignore_lower_dimension=True).count(),
+            3045
+        )
 
     def test_operator_u_uc_GL_GR_D(self):
         operator = u(1) * uc(1) * GL * GR
@@ -0,0 +1,31 @@
+from basisgen.weights import Weight
+
+import pickle
+import unittest
+
+
+class TestWeight(unittest.TestCase):
+    def test_arithmetic(self):
+        weight = Weight([1, 0, 2])
+        other = Weight([0, 1, -1])
+
+        self.assertEqual(weight + other, Weight([1, 1, 1]))
+        self.assertEqual(weight - other, Weight([1, -1, 3]))
+        self.assertEqual(weight + (0, 1, -1), Weight([1, 1, 1]))
+        self.assertEqual(weight - [0, 1, -1], Weight([1, -1, 3]))
+        self.assertEqual(-weight, Weight([-1, 0, -2]))
+        self.assertEqual(2 * weight, Weight([2, 0, 4]))
+        self.assertEqual(weight[1:].concat(other[:1]), Weight([0, 2, 0]))
+
+    def test_hash_and_pickle(self):
+        weight = Weight([1, 0, 2])
+
+        self.assertEqual(
+            hash(weight + Weight([0, 1, -1])),
+            hash(Weight((1, 1, 1)))
+        )
+        self.assertEqual(pickle.loads(pickle.dumps(weight)), weight)
+
+
+if __name__ == '__main__':
+    unittest.main()